@@ -1,6 +1,151 @@
 import requests
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Timeout in seconds for every HTTP request
+HTTP_TIMEOUT = 15
+
+_http_session: Optional[requests.Session] = None
+
+
+def get_http_session() -> requests.Session:
+  """Return the shared HTTP session, creating it on first use.
+
+  Reusing one pooled session avoids a new TCP/TLS handshake per request.
+  """
+  global _http_session
+  if _http_session is None:
+    _http_session = requests.Session()
+    adapter = HTTPAdapter(
+      pool_connections=4,
+      pool_maxsize=8,
+      max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    _http_session.mount("https://", adapter)
+    _http_session.mount("http://", adapter)
+  return _http_session
+
+
+@lru_cache(maxsize=64)
+def _fetch_google_books(clean_query: str) -> Tuple[Dict, ...]:
+  """Query Google Books and return standardized metadata for every result.
+
+  Results are cached per normalized query. Network errors propagate so that
+  failed lookups are never cached.
+  """
+  # Google Books API endpoint
+  url = f"https://www.googleapis.com/books/v1/volumes"
+  params = {
+    "q": clean_query,
+    "maxResults": 10,  # Get more results when searching
+    "langRestrict": "en",  # Restrict to English results
+    "orderBy": "relevance",  # Order by relevance
+  }
+
+  session = get_http_session()
+  response = session.get(url, params=params, timeout=HTTP_TIMEOUT)
+  response.raise_for_status()
+  data = response.json()
+
+  if "items" not in data or not data["items"]:
+    return ()
+
+  results = []
+  for item in data["items"]:
+    # Get full volume details to access all image sizes
+    volume_id = item.get("id")
+    if volume_id:
+      volume_url = f"https://www.googleapis.com/books/v1/volumes/{volume_id}"
+      volume_response = session.get(volume_url, timeout=HTTP_TIMEOUT)
+      if volume_response.status_code == 200:
+        item = volume_response.json()
+
+    info = item.get("volumeInfo", {})
+
+    # Extract and standardize metadata
+    metadata = {
+      "title": info.get("title", ""),
+      "artist": (info.get("authors", [""])[0] if info.get("authors") else ""),
+      "album_artist": "",  # Narrator (not available in Google Books)
+      "album": (
+        info.get("series", {}).get("title", "")
+        if info.get("series")
+        else ""
+      ),
+      "track": (
+        str(
+          info.get("series", {})
+          .get("seriesInfo", {})
+          .get("seriesPosition", "")
+        )
+        if info.get("series")
+        else ""
+      ),
+      "genre": (
+        info.get("categories", [""])[0] if info.get("categories") else ""
+      ),
+      "date": (
+        info.get("publishedDate", "")[:4]
+        if info.get("publishedDate")
+        else ""
+      ),  # Just get the year
+      "description": info.get("description", ""),
+    }
+
+    # Try to get the highest quality cover image
+    if info.get("imageLinks"):
+      # Try different image sizes in order of preference
+      image_sizes = [
+        "extraLarge",
+        "large",
+        "medium",
+        "small",
+        "thumbnail",
+        "smallThumbnail",
+      ]
+      cover_url = None
+
+      for size in image_sizes:
+        if size in info["imageLinks"]:
+          cover_url = info["imageLinks"][size]
+          break
+
+      if cover_url:
+        # Convert to HTTPS and enhance quality
+        cover_url = cover_url.replace("http://", "https://")
+
+        # Try different URL patterns to get highest quality
+        patterns = [
+          ("&zoom=1", "&zoom=10"),
+          ("&zoom=5", "&zoom=10"),
+          ("&edge=curl", "&edge=none"),
+          ("w=128", "w=2048"),
+          ("h=192", "h=3072"),
+          ("&pg=PP1", "&printsec=frontcover"),
+          ("&img=1", "&img=2"),
+          ("&fife=", "&fife=w2048-h3072"),
+        ]
+
+        for old, new in patterns:
+          cover_url = cover_url.replace(old, new)
+
+        # Add additional parameters for quality
+        if "?" in cover_url:
+          cover_url += "&source=gbs_api&printsec=frontcover&dq=isbn"
+
+        metadata["cover_url"] = cover_url
+
+    results.append(metadata)
+
+  return tuple(results)
+
+
+def clear_search_cache() -> None:
+  """Forget all cached Google Books search results."""
+  _fetch_google_books.cache_clear()
 
 
 def search_google_books(query: str, multiple: bool = False) -> Optional[Dict]:
@@ -16,110 +161,12 @@ def search_google_books(query: str, multiple: bool = False) -> Optional[Dict]:
     # Clean up query by removing common audiobook indicators
     clean_query = query.lower().replace("audiobook", "").strip()
 
-    # Google Books API endpoint
-    url = f"https://www.googleapis.com/books/v1/volumes"
-    params = {
-      "q": clean_query,
-      "maxResults": 10,  # Get more results when searching
-      "langRestrict": "en",  # Restrict to English results
-      "orderBy": "relevance",  # Order by relevance
-    }
-
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-    data = response.json()
-
-    if "items" not in data or not data["items"]:
+    # Copy the cached dicts so callers can't mutate the cache
+    results = [dict(metadata) for metadata in _fetch_google_books(clean_query)]
+    if not results:
       logging.warning(f"No results found for query: {query}")
       return [] if multiple else None
 
-    results = []
-    for item in data["items"]:
-      # Get full volume details to access all image sizes
-      volume_id = item.get("id")
-      if volume_id:
-        volume_url = f"https://www.googleapis.com/books/v1/volumes/{volume_id}"
-        volume_response = requests.get(volume_url)
-        if volume_response.status_code == 200:
-          item = volume_response.json()
-
-      info = item.get("volumeInfo", {})
-
-      # Extract and standardize metadata
-      metadata = {
-        "title": info.get("title", ""),
-        "artist": (info.get("authors", [""])[0] if info.get("authors") else ""),
-        "album_artist": "",  # Narrator (not available in Google Books)
-        "album": (
-          info.get("series", {}).get("title", "")
-          if info.get("series")
-          else ""
-        ),
-        "track": (
-          str(
-            info.get("series", {})
-            .get("seriesInfo", {})
-            .get("seriesPosition", "")
-          )
-          if info.get("series")
-          else ""
-        ),
-        "genre": (
-          info.get("categories", [""])[0] if info.get("categories") else ""
-        ),
-        "date": (
-          info.get("publishedDate", "")[:4]
-          if info.get("publishedDate")
-          else ""
-        ),  # Just get the year
-        "description": info.get("description", ""),
-      }
-
-      # Try to get the highest quality cover image
-      if info.get("imageLinks"):
-        # Try different image sizes in order of preference
-        image_sizes = [
-          "extraLarge",
-          "large",
-          "medium",
-          "small",
-          "thumbnail",
-          "smallThumbnail",
-        ]
-        cover_url = None
-
-        for size in image_sizes:
-          if size in info["imageLinks"]:
-            cover_url = info["imageLinks"][size]
-            break
-
-        if cover_url:
-          # Convert to HTTPS and enhance quality
-          cover_url = cover_url.replace("http://", "https://")
-
-          # Try different URL patterns to get highest quality
-          patterns = [
-            ("&zoom=1", "&zoom=10"),
-            ("&zoom=5", "&zoom=10"),
-            ("&edge=curl", "&edge=none"),
-            ("w=128", "w=2048"),
-            ("h=192", "h=3072"),
-            ("&pg=PP1", "&printsec=frontcover"),
-            ("&img=1", "&img=2"),
-            ("&fife=", "&fife=w2048-h3072"),
-          ]
-
-          for old, new in patterns:
-            cover_url = cover_url.replace(old, new)
-
-          # Add additional parameters for quality
-          if "?" in cover_url:
-            cover_url += "&source=gbs_api&printsec=frontcover&dq=isbn"
-
-          metadata["cover_url"] = cover_url
-
-      results.append(metadata)
-
     if multiple:
       return results
 
@@ -152,9 +199,10 @@ def search_google_books(query: str, multiple: bool = False) -> Optional[Dict]:
 
 
 def get_book_cover(isbn):
+  session = get_http_session()
   # Try Google Books API first
   google_books_url = f"https://www.googleapis.com/books/v1/volumes?q=isbn:{isbn}"
-  google_response = requests.get(google_books_url)
+  google_response = session.get(google_books_url, timeout=HTTP_TIMEOUT)
 
   if google_response.status_code == 200:
     google_data = google_response.json()
@@ -169,13 +217,15 @@ def get_book_cover(isbn):
         for size in ["extraLarge", "large", "thumbnail"]:
           if size in google_image_links:
             google_cover_url = google_image_links[size]
-            google_cover_response = requests.get(google_cover_url)
+            google_cover_response = session.get(
+              google_cover_url, timeout=HTTP_TIMEOUT
+            )
             if google_cover_response.status_code == 200:
               return google_cover_response.content
 
   # If Google Books API fails, try Open Library API
   open_library_url = f"https://covers.openlibrary.org/b/isbn/{isbn}-L.jpg"
-  open_library_response = requests.get(open_library_url)
+  open_library_response = session.get(open_library_url, timeout=HTTP_TIMEOUT)
 
   if open_library_response.status_code == 200:
     return open_library_response.content
@@ -0,0 +1,84 @@
+import logging
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from audiobook_converter.core.book_api import (
+  HTTP_TIMEOUT,
+  get_http_session,
+  search_google_books,
+)
+
+# Title keywords of results that are not the book itself
+EXCLUDED_TITLE_WORDS = ["summary", "quicklet", "cliffnotes", "study guide"]
+
+
+class BookFetchSignals(QObject):
+  metadata_ready = pyqtSignal(dict)
+  cover_ready = pyqtSignal(bytes, str)
+  warning = pyqtSignal(str)
+  error = pyqtSignal(str)
+  finished = pyqtSignal()
+
+
+class BookFetchWorker(QRunnable):
+  """Search Google Books and download a cover off the GUI thread.
+
+  Emits metadata_ready for each candidate book in order, until one whose
+  cover downloads successfully, which is then emitted with cover_ready as
+  (image bytes, cover URL).
+  """
+
+  def __init__(self, query: str):
+    super().__init__()
+    self.query = query
+    self.signals = BookFetchSignals()
+
+  def run(self):
+    try:
+      # Get all matching books
+      all_metadata = search_google_books(self.query, multiple=True)
+      if not all_metadata:
+        self.signals.warning.emit("No matching book found.")
+        return
+
+      # Filter out summaries/study guides
+      valid_books = [
+        book
+        for book in all_metadata
+        if not any(
+          x in book.get("title", "").lower() for x in EXCLUDED_TITLE_WORDS
+        )
+      ]
+
+      if not valid_books:
+        self.signals.warning.emit(
+          "Found only summaries/study guides. Please try adding the author name if not specified."
+        )
+        return
+
+      # Sort by publication date (ascending) to get the earliest edition first
+      valid_books.sort(
+        key=lambda x: x.get("date", "9999")
+      )  # Default to far future if no date
+
+      # Iterate through valid books to find a cover image
+      session = get_http_session()
+      for metadata in valid_books:
+        self.signals.metadata_ready.emit(metadata)
+
+        cover_url = metadata.get("cover_url")
+        if cover_url:
+          try:
+            response = session.get(cover_url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            self.signals.cover_ready.emit(response.content, cover_url)
+            return
+          except Exception as e:
+            logging.error(f"Error downloading cover image: {str(e)}")
+
+      logging.warning("No cover image found")
+
+    except Exception as e:
+      logging.error(f"Error fetching book metadata: {str(e)}")
+      self.signals.error.emit(str(e))
+
+    finally:
+      self.signals.finished.emit()
@@ -8,6 +8,7 @@ class ConversionThread(QThread):
   finished = pyqtSignal()
   error = pyqtSignal(str)
   stopped = pyqtSignal()
+  progress = pyqtSignal(int)
 
   def __init__(
     self,
@@ -37,6 +38,7 @@ class ConversionThread(QThread):
         settings=self.settings,
         chapter_titles=self.chapter_titles,
         stop_event=lambda: self._stop_requested,
+        progress_callback=self.progress.emit,
       )
       if self._stop_requested:
         self.stopped.emit()
@@ -1,95 +1,311 @@
 import os
+import json
 import logging
-from typing import List, Dict, Optional
-import ffmpeg
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import IntEnum
+from typing import Callable, List, Dict, Optional, Tuple
+import mutagen
 from pathlib import Path
+from mutagen.aac import AAC
+from mutagen.mp3 import MP3
 from mutagen.mp4 import MP4, MP4Cover
 
 
-def check_dependencies() -> bool:
-    """Check if required dependencies (ffmpeg and ffprobe) are available using ffmpeg-python only."""
-    try:
-        # Try probing a non-existent file to check if ffmpeg/ffprobe are callable
+class Codec(IntEnum):
+    """Audio codec choices for the conversion settings."""
+
+    AUTO = 0  # Copy the source streams if they are all AAC
+    AAC = 1
+    AAC_LC = 2
+
+
+# Input file extensions picked up by process_audio_files
+AUDIO_EXTENSIONS = (".mp3", ".m4a", ".m4b", ".aac")
+
+# Source codecs that can be stream-copied into the M4B
+AAC_CODECS = frozenset({"aac", "mp4a"})
+
+
+# ffmpeg and ffprobe executables, resolved to absolute paths by check_dependencies
+FFMPEG_BIN = "ffmpeg"
+FFPROBE_BIN = "ffprobe"
+_deps_ok = False
+
+# Seconds between stop checks while waiting on an ffmpeg process
+STOP_POLL_INTERVAL = 0.2
+
+# Share of the progress bar for encoding when the files are re-encoded, the
+# final concatenation fills the rest
+ENCODE_PROGRESS = 90
+
+# Chapter metadata file layout, timestamps in milliseconds
+_FFMETADATA_HEADER = ";FFMETADATA1\n"
+_CHAPTER_TMPL = "\n[CHAPTER]\nTIMEBASE=1/1000\nSTART={start}\nEND={end}\ntitle={title}\n"
+
+# Characters FFMETADATA values must backslash-escape, backslash included in the
+# same pass so the added escapes aren't escaped again
+_METADATA_ESCAPES = str.maketrans({c: "\\" + c for c in "=;#\\\n"})
+
+# Single quote inside a quoted concat list path: close, escaped quote, reopen
+_CONCAT_QUOTE = "'\\''"
+
+# Only the fields probe_file reads, to keep ffprobe's JSON output small
+PROBE_ENTRIES = (
+    "stream=codec_type,codec_name,duration,sample_rate,channels"
+    ":format=duration:format_tags=title"
+)
+
+
+def check_aac_encoder() -> bool:
+    """Check that ffmpeg can encode AAC into an M4B container.
+
+    Encodes a hundredth of a second of generated silence, which takes a few
+    tens of milliseconds.
+    """
+    with tempfile.TemporaryDirectory(prefix="m4b_") as work_dir:
+        cmd_args = build_ffmpeg_cmd(
+            [("anullsrc=r=44100:cl=mono", {"f": "lavfi"})],
+            os.path.join(work_dir, "check.m4b"),
+            {"t": 0.01, "c:a": "aac", "f": "ipod"},
+            ["-nostdin", "-v", "error"],
+        )
         try:
-            ffmpeg.probe("__definitely_not_a_real_file__.mp3")
-        except ffmpeg.Error as e:
-            stderr = e.stderr.decode("utf-8", errors="replace") if e.stderr else str(e)
-            if "No such file or directory" in stderr or "could not find" in stderr:
-                logging.info(
-                    "ffmpeg and ffprobe are available (error is for missing file, which is expected)."
-                )
-                return True
-            else:
-                logging.error(
-                    f"ffmpeg or ffprobe not found or not working properly: {stderr}"
-                )
-                return False
-        return True
-    except Exception as e:
-        logging.error(f"Error checking ffmpeg/ffprobe: {str(e)}")
+            result = subprocess.run(cmd_args, capture_output=True, timeout=5)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logging.error("ffmpeg AAC check failed: %s", e)
+            return False
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        logging.error("ffmpeg cannot encode AAC to M4B: %s", stderr.strip())
         return False
+    return True
 
 
-def get_audio_duration(file_path: str) -> float:
-    """Get duration of audio file in seconds using ffprobe."""
+def check_ffprobe() -> bool:
+    """Check that ffprobe runs."""
     try:
-        # Get audio stream info using ffmpeg-python
-        probe = ffmpeg.probe(file_path)
-
-        # First try to get duration from audio stream
-        audio_stream = next(
-            (stream for stream in probe["streams"] if stream["codec_type"] == "audio"),
-            None,
+        result = subprocess.run(
+            [FFPROBE_BIN, "-version"], capture_output=True, timeout=5
         )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logging.error("ffprobe check failed: %s", e)
+        return False
+
+    if result.returncode != 0:
+        logging.error("ffprobe exited with code %d", result.returncode)
+        return False
+    return True
 
-        if audio_stream and "duration" in audio_stream:
-            duration_secs = float(audio_stream["duration"])
-        else:
-            # If stream duration is not available, try format duration
-            duration_secs = float(probe["format"]["duration"])
 
-        if duration_secs <= 0:
-            raise ValueError(f"Invalid duration: {duration_secs}")
+def check_dependencies() -> bool:
+    """Check if required dependencies (ffmpeg and ffprobe) are available.
 
-        logging.info(
-            f"Duration for {os.path.basename(file_path)}: {duration_secs} seconds"
-        )
-        return duration_secs
-    except Exception as e:
-        logging.error(f"Error getting duration for {file_path}: {str(e)}")
-        raise
+    Looks both up on the PATH, then runs a tiny AAC encode and ffprobe at the
+    same time. A successful check is cached, so later conversions skip it.
+    """
+    global FFMPEG_BIN, FFPROBE_BIN, _deps_ok
+    if _deps_ok:
+        return True
 
+    ffmpeg_bin = shutil.which("ffmpeg")
+    ffprobe_bin = shutil.which("ffprobe")
+    if not ffmpeg_bin or not ffprobe_bin:
+        missing = [
+            name
+            for name, path in (("ffmpeg", ffmpeg_bin), ("ffprobe", ffprobe_bin))
+            if not path
+        ]
+        logging.error("Not found on PATH: %s", ", ".join(missing))
+        return False
 
-def get_audio_title(file_path: str) -> str:
-    """Get title from audio metadata or filename."""
-    try:
-        # Get metadata using ffmpeg-python
-        probe = ffmpeg.probe(file_path)
+    FFMPEG_BIN, FFPROBE_BIN = ffmpeg_bin, ffprobe_bin
+
+    # Both checks wait on a subprocess, run them together
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        checks = [executor.submit(check_aac_encoder), executor.submit(check_ffprobe)]
+        if not all(check.result() for check in checks):
+            return False
+
+    _deps_ok = True
+    logging.info("Using ffmpeg at %s and ffprobe at %s", FFMPEG_BIN, FFPROBE_BIN)
+    return True
 
-        # Try to get title from metadata
-        title = ""
-        if "tags" in probe["format"] and "title" in probe["format"]["tags"]:
-            title = probe["format"]["tags"]["title"]
 
-        # If no metadata title, use filename
-        if not title:
-            title = Path(file_path).stem
+def clean_title(title: str) -> str:
+    """Strip surrounding quotes and collapse whitespace in a title."""
+    # Remove quotes from start and end
+    title = title.strip("\"'")
+    # Replace multiple spaces with single space
+    return " ".join(title.split())
 
-        # Clean up the title
-        # Remove quotes from start and end
-        title = title.strip("\"'")
-        # Replace multiple spaces with single space
-        title = " ".join(title.split())
 
-        return title
+def read_file_tags(file_path: str) -> Optional[Dict]:
+    """Get duration, title, codec and format of an audio file with mutagen.
 
+    Reading the headers in-process is much cheaper than spawning ffprobe.
+
+    Args:
+        file_path: Path of the audio file
+
+    Returns:
+        Dict like probe_file(), or None if mutagen can't tell the duration or codec
+    """
+    try:
+        audio = mutagen.File(file_path, easy=True)
     except Exception:
-        logging.warning(f"Failed to get title metadata for {file_path}, using filename")
-        # Clean up filename same way
-        title = Path(file_path).stem
-        title = title.strip("\"'")
-        title = " ".join(title.split())
-        return title
+        return None
+    if audio is None or not audio.info.length:
+        return None
+
+    if isinstance(audio, MP4):
+        # mp4a.40.x is AAC, other mp4a object types (like MP3 in MP4) are not
+        codec = audio.info.codec
+        codec = "aac" if codec.startswith("mp4a.40") else codec.lower()
+    elif isinstance(audio, MP3):
+        codec = "mp3"
+    elif isinstance(audio, AAC):
+        codec = "aac"
+    else:
+        return None
+
+    title = (audio.tags or {}).get("title", [""])[0] or Path(file_path).stem
+    return {
+        "duration": float(audio.info.length),
+        "title": clean_title(title),
+        "codec": codec,
+        "sample_rate": audio.info.sample_rate or 0,
+        "channels": audio.info.channels or 0,
+    }
+
+
+def probe_file(file_path: str) -> Dict:
+    """Get duration, title, codec and format of an audio file.
+
+    Uses mutagen when it can read the file and a single ffprobe call otherwise.
+
+    Args:
+        file_path: Path of the audio file
+
+    Returns:
+        Dict with "duration" in seconds (0.0 if unknown), "title" (falls back
+        to the filename), lowercase "codec" name (empty if unknown), and
+        "sample_rate" in Hz and "channels" (0 if unknown)
+    """
+    info = read_file_tags(file_path)
+    if info:
+        return info
+
+    result = subprocess.run(
+        [
+            FFPROBE_BIN,
+            "-v",
+            "error",
+            "-show_entries",
+            PROBE_ENTRIES,
+            "-of",
+            "json",
+            file_path,
+        ],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"ffprobe error: {stderr.strip()}")
+
+    # json.loads takes the raw bytes, skipping a separate decode pass
+    probe = json.loads(result.stdout)
+
+    audio_stream = next(
+        (
+            stream
+            for stream in probe.get("streams", [])
+            if stream.get("codec_type") == "audio"
+        ),
+        None,
+    )
+    fmt = probe.get("format", {})
+
+    # Prefer the audio stream duration, then the container duration
+    if audio_stream and "duration" in audio_stream:
+        duration = float(audio_stream["duration"])
+    else:
+        duration = float(fmt.get("duration", 0.0))
+
+    title = fmt.get("tags", {}).get("title", "") or Path(file_path).stem
+    audio_stream = audio_stream or {}
+    codec = audio_stream.get("codec_name", "").lower()
+
+    return {
+        "duration": duration,
+        "title": clean_title(title),
+        "codec": codec,
+        # ffprobe reports the sample rate as a string
+        "sample_rate": int(audio_stream.get("sample_rate") or 0),
+        "channels": int(audio_stream.get("channels") or 0),
+    }
+
+
+def check_duration(file_path: str, info: Dict) -> float:
+    """Validate and log the duration of a probed file."""
+    duration_secs = info["duration"]
+    if duration_secs <= 0:
+        raise ValueError(f"Invalid duration: {duration_secs}")
+
+    logging.info(
+        "Duration for %s: %s seconds", os.path.basename(file_path), duration_secs
+    )
+    return duration_secs
+
+
+def probe_files(
+    files: List[str], probe_cache: Optional[Dict[str, Dict]] = None
+) -> Dict[str, Dict]:
+    """Probe files concurrently, reusing results already in the cache.
+
+    Args:
+        files: Paths of the audio files
+        probe_cache: Optional dict of path to probe_file() result, updated in place
+
+    Returns:
+        The cache, holding an entry for every file
+    """
+    if probe_cache is None:
+        probe_cache = {}
+
+    missing = [file for file in dict.fromkeys(files) if file not in probe_cache]
+    if not missing:
+        return probe_cache
+
+    def probe_one(file: str) -> Dict:
+        try:
+            return probe_file(file)
+        except Exception as e:
+            logging.error("Error probing %s: %s", file, e)
+            raise
+
+    # Probes mostly wait on file reads or ffprobe, so run them concurrently
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for file, info in zip(missing, executor.map(probe_one, missing)):
+            probe_cache[file] = info
+
+    return probe_cache
+
+
+def get_audio_title(file_path: str) -> str:
+    """Get title from audio metadata or filename."""
+    try:
+        return probe_file(file_path)["title"]
+    except Exception:
+        logging.warning(
+            "Failed to get title metadata for %s, using filename", file_path
+        )
+        return clean_title(Path(file_path).stem)
 
 
 def process_audio_files(directory: str, recursive: bool = False) -> List[str]:
@@ -98,93 +314,254 @@ def process_audio_files(directory: str, recursive: bool = False) -> List[str]:
         raise FileNotFoundError(f"Input directory '{directory}' not found.")
 
     audio_files = []
-    seen_files = set()
-
-    for root, _, files in os.walk(directory):
-        for file in sorted(files):
-            if file.lower().endswith((".mp3", ".m4a", ".m4b", ".aac")):
-                full_path = os.path.abspath(os.path.join(root, file))
-                if full_path not in seen_files:
-                    audio_files.append(full_path)
-                    seen_files.add(full_path)
-                    logging.debug(f"Found audio file: {file}")
-        if not recursive:
-            break
+
+    def scan(path: str) -> None:
+        # One scandir pass per directory, DirEntry caches the file type
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                audio_files.append(os.path.abspath(entry.path))
+                logging.debug("Found audio file: %s", entry.name)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+
+        for subdir in subdirs:
+            scan(subdir)
+
+    scan(directory)
 
     if not audio_files:
         raise ValueError("No audio files found in the input directory.")
 
-    logging.info(f"Found {len(audio_files)} audio files")
+    logging.info("Found %d audio files", len(audio_files))
     return audio_files
 
 
 def create_chapter_metadata(
-    files: List[str], titles: Optional[List[str]] = None
+    files: List[str],
+    titles: Optional[List[str]] = None,
+    probe_cache: Optional[Dict[str, Dict]] = None,
+    work_dir: str = ".",
 ) -> str:
     """Generate chapter metadata for ffmpeg."""
     if not files:
         return ""
 
-    chapter_file = "chapters.txt"
-    start_time = 0
+    chapter_file = os.path.join(work_dir, "chapters.txt")
+    start_time = 0.0  # Seconds
 
-    with open(chapter_file, "w", encoding="utf-8") as f:
-        f.write(";FFMETADATA1\n")
-
-        for i, file in enumerate(files):
-            duration = get_audio_duration(file) * 1000  # Convert to milliseconds
-            title = titles[i] if titles and i < len(titles) else get_audio_title(file)
-
-            # Escape special characters in title
-            escaped_title = (
-                title.replace("=", "\\=")
-                .replace(";", "\\;")
-                .replace("#", "\\#")
-                .replace("\\", "\\\\")
-            )
+    probe_cache = probe_files(files, probe_cache)
 
-            logging.info(
-                f"Chapter {i+1}: {title} (Duration: {duration/1000:.2f} seconds)"
-            )
+    parts = [_FFMETADATA_HEADER]
+    for i, file in enumerate(files):
+        info = probe_cache[file]
+        duration = check_duration(file, info)
+        title = titles[i] if titles and i < len(titles) else info["title"]
 
-            f.write("\n[CHAPTER]\n")
-            f.write("TIMEBASE=1/1000\n")
-            f.write(f"START={int(start_time)}\n")
-            f.write(f"END={int(start_time + duration)}\n")
-            f.write(f"title={escaped_title}\n")
+        # Escape special characters in title
+        escaped_title = title.translate(_METADATA_ESCAPES)
 
-            start_time += duration
+        logging.info(
+            "Chapter %d: %s (Duration: %.2f seconds)", i + 1, title, duration
+        )
 
-    return chapter_file
+        # Round each boundary from the running total in seconds, the same
+        # offsets the concat duration directives give the demuxer, so chapter
+        # marks don't drift from the audio over hundreds of files
+        start_ms = round(start_time * 1000)
+        start_time += duration
+        end_ms = round(start_time * 1000)
 
+        parts.append(
+            _CHAPTER_TMPL.format(start=start_ms, end=end_ms, title=escaped_title)
+        )
 
-def create_concat_file(files: List[str]) -> str:
-    """Create a concat format file for ffmpeg."""
-    concat_file = "concat.txt"
-    with open(concat_file, "w", encoding="utf-8") as f:
-        for file in files:
-            # Escape single quotes and backslashes for FFmpeg's concat protocol
-            escaped_path = os.path.abspath(file).replace("'", "'\\''")
-            f.write(f"file '{escaped_path}'\n")
-            logging.info(f"Adding file: {os.path.basename(file)}")
-    return concat_file
+    # Write the whole file at once instead of several writes per chapter
+    with open(chapter_file, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
 
+    return chapter_file
 
-def get_audio_codec(file_path: str) -> str:
-    """Get audio codec of the file using ffprobe."""
-    try:
-        probe = ffmpeg.probe(file_path)
-        audio_stream = next(
-            (stream for stream in probe["streams"] if stream["codec_type"] == "audio"),
-            None,
+
+def build_concat_list(
+    files: List[str], durations: Optional[List[float]] = None
+) -> str:
+    """Build a concat demuxer list for ffmpeg, fed to it through stdin.
+
+    Args:
+        files: Paths of the audio files
+        durations: Optional duration in seconds of each file, written as
+            duration directives so the demuxer doesn't have to work them out
+
+    Returns:
+        The concat list
+    """
+    lines = []
+    for i, file in enumerate(files):
+        # Escape single quotes and backslashes for FFmpeg's concat protocol
+        escaped_path = os.path.abspath(file).replace("'", _CONCAT_QUOTE)
+        # Entries resolve against the list's own URL, which is pipe:0, so
+        # name the file protocol explicitly
+        lines.append(f"file 'file:{escaped_path}'\n")
+        if durations:
+            lines.append(f"duration {durations[i]:.6f}\n")
+        logging.info("Adding file: %s", os.path.basename(file))
+    return "".join(lines)
+
+
+def can_copy_audio(files: List[str], probe_cache: Dict[str, Dict]) -> bool:
+    """Check if all files are AAC in the same format, stopping at the first one
+    that is not.
+
+    Concatenating by copy can't change the sample rate or channel count, so
+    every file has to match the first one.
+    """
+    first = probe_cache[files[0]]
+    for file in files:
+        info = probe_cache[file]
+        if info["codec"] not in AAC_CODECS:
+            logging.info("%s is not AAC", os.path.basename(file))
+            return False
+        if (info["sample_rate"], info["channels"]) != (
+            first["sample_rate"],
+            first["channels"],
+        ):
+            logging.info(
+                "%s differs in sample rate or channels from %s",
+                os.path.basename(file),
+                os.path.basename(files[0]),
+            )
+            return False
+    return True
+
+
+def build_ffmpeg_cmd(
+    inputs: List[Tuple[str, Dict]],
+    output: str,
+    output_options: Dict,
+    global_options: Optional[List[str]] = None,
+) -> List[str]:
+    """Build an ffmpeg argv in one pass.
+
+    Options are dicts keyed by flag name without the dash, so no flag can be
+    given twice; a None value adds the flag alone.
+
+    Args:
+        inputs: (path, input options) pairs, in input index order
+        output: Output path
+        output_options: Options applied to the output, like codec and maps
+        global_options: Extra global arguments, like log level
+
+    Returns:
+        Full argument list, starting with the ffmpeg executable
+    """
+
+    def flags(options: Dict):
+        for key, value in options.items():
+            yield f"-{key}"
+            if value is not None:
+                yield str(value)
+
+    args = [FFMPEG_BIN, "-y", *(global_options or [])]
+    for path, options in inputs:
+        args.extend(flags(options))
+        args.extend(("-i", path))
+    args.extend(flags(output_options))
+    args.append(output)
+    return args
+
+
+def encode_files(
+    files: List[str],
+    work_dir: str,
+    output_options: Dict,
+    jobs: Optional[int] = None,
+    stop_event=None,
+    progress_callback: Optional[Callable[[int], None]] = None,
+) -> List[str]:
+    """Encode files to AAC .m4a intermediates, several at a time.
+
+    The AAC encoder is mostly single-threaded, so one ffmpeg process per file
+    keeps all cores busy. The intermediates can then be concatenated by copy.
+
+    Args:
+        files: Paths of the audio files
+        work_dir: Directory to write the intermediates to
+        output_options: ffmpeg output options for the encode
+        jobs: Number of files to encode at once, defaults to the CPU count
+        stop_event: Optional callable returning True to cancel the encode
+        progress_callback: Optional callable receiving the percent of files done
+
+    Returns:
+        Paths of the intermediates, in input order
+    """
+    outputs = [os.path.join(work_dir, f"{i:04d}.m4a") for i in range(len(files))]
+    # Set when a file fails, so the encodes still running give up early
+    failed = threading.Event()
+
+    def should_stop() -> bool:
+        return failed.is_set() or bool(stop_event and stop_event())
+
+    def encode_one(src: str, dst: str) -> None:
+        if should_stop():
+            raise RuntimeError("Conversion stopped by user")
+
+        logging.info("Encoding %s", os.path.basename(src))
+        cmd_args = build_ffmpeg_cmd(
+            [(src, {})],
+            dst,
+            # One thread per process, the parallelism comes from the pool
+            {"vn": None, "threads": 1, **output_options},
+            ["-nostdin", "-v", "error"],
+        )
+        process = subprocess.Popen(
+            cmd_args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
 
-        if audio_stream and "codec_name" in audio_stream:
-            return audio_stream["codec_name"].lower()
-        return ""
-    except Exception:
-        logging.warning(f"Failed to get codec info for {file_path}")
-        return ""
+        # Wait in short slices so a stop request also ends running encodes
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=STOP_POLL_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                if should_stop():
+                    process.kill()
+                    process.communicate()
+                    raise RuntimeError("Conversion stopped by user")
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"FFmpeg error encoding {os.path.basename(src)}: "
+                f"{stderr.decode('utf-8', errors='replace')}"
+            )
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures = [executor.submit(encode_one, *pair) for pair in zip(files, outputs)]
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                logging.info("Encoded %d/%d files", done, len(files))
+                if progress_callback:
+                    progress_callback(done * 100 // len(files))
+        except Exception:
+            # Don't start the remaining files once one has failed
+            failed.set()
+            executor.shutdown(cancel_futures=True)
+            raise
+
+    return outputs
+
+
+def drain_stream(stream, lines: deque) -> None:
+    """Collect the lines of an ffmpeg output stream until it closes."""
+    for line in iter(stream.readline, b""):
+        lines.append(line.decode("utf-8", errors="replace").rstrip())
 
 
 def generate_m4b(
@@ -194,153 +571,222 @@ def generate_m4b(
     settings: Optional[Dict] = None,
     chapter_titles: Optional[List[str]] = None,
     stop_event=None,
+    progress_callback: Optional[Callable[[int], None]] = None,
 ) -> None:
     """Generate M4B file from input files."""
     if not check_dependencies():
         raise RuntimeError("Required dependencies not found")
 
-    temp_files = []
     try:
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
-
-        # Process input files
-        input_files = process_audio_files(input_dir)
-
-        # Check if all files are AAC for copy mode
-        can_copy = False
-        if settings and settings.get("codec") == "Auto (Copy if possible)":
-            can_copy = all(get_audio_codec(f) in ["aac", "mp4a"] for f in input_files)
+        # Chapter metadata and encoded intermediates go in a per-run directory,
+        # removed with everything in it even if the conversion fails
+        with tempfile.TemporaryDirectory(prefix="m4b_") as work_dir:
+            # Ensure output directory exists
+            os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+
+            # Process input files
+            input_files = process_audio_files(input_dir)
+
+            # Probe every file once for both the codec check and the chapters
+            probe_cache = probe_files(input_files)
+
+            # Check if all files are AAC for copy mode
+            can_copy = False
+            if settings and settings.get("codec") == Codec.AUTO:
+                if settings.get("force_conversion"):
+                    logging.info("Force conversion enabled, will convert to AAC")
+                else:
+                    can_copy = can_copy_audio(input_files, probe_cache)
+                    if not can_copy:
+                        logging.info(
+                            "Files can't be copied as they are, will convert to AAC"
+                        )
+
+            concat_inputs = input_files
+            durations = None
+            # Where the final step's progress starts on the 0-100 scale
+            final_start = 0
             if not can_copy:
-                logging.info(
-                    "Some files are not AAC, will convert to AAC instead of copying"
+                # Set up codec options
+                encode_options = {"c:a": "aac"}
+
+                # The intermediates are concatenated by copy, so they all need
+                # the same sample rate and channel count. Auto follows the
+                # first file
+                first = probe_cache[input_files[0]]
+                sample_rate = first["sample_rate"]
+
+                # Audio codec settings
+                if settings:
+                    # Bitrate in kbps, 0 means Auto
+                    bitrate = settings.get("bitrate", 128)
+                    if bitrate:
+                        encode_options["b:a"] = f"{bitrate}k"
+                    # Sample rate in Hz, 0 means Auto
+                    sample_rate = settings.get("sample_rate") or sample_rate
+                else:
+                    # Default audio settings
+                    encode_options["b:a"] = "128k"
+
+                if sample_rate:
+                    encode_options["ar"] = str(sample_rate)
+                if first["channels"]:
+                    encode_options["ac"] = str(first["channels"])
+
+                # Encode the files in parallel, the final pass then only copies
+                def encode_progress(percent: int) -> None:
+                    progress_callback(percent * ENCODE_PROGRESS // 100)
+
+                concat_inputs = encode_files(
+                    input_files,
+                    work_dir,
+                    encode_options,
+                    jobs=settings.get("jobs") if settings else None,
+                    stop_event=stop_event,
+                    progress_callback=encode_progress if progress_callback else None,
                 )
-
-        # Create concat and chapter files
-        concat_file = create_concat_file(input_files)
-        temp_files.append(concat_file)
-
-        chapter_file = create_chapter_metadata(input_files, chapter_titles)
-        temp_files.append(chapter_file)
-
-        # The ffmpeg-python package has limitations with complex mapping scenarios
-        # We'll use a hybrid approach: use ffmpeg-python to build the command
-        # but handle the stream mapping more carefully
-
-        # Start building the command
-        stream = ffmpeg.input(concat_file, format="concat", safe=0)
-
-        # Set up codec options
-        output_options = {}
-
-        # Audio codec settings
-        if settings:
-            codec = settings.get("codec", "AAC")
-            if codec == "Auto (Copy if possible)" and can_copy:
-                output_options["c:a"] = "copy"
-            else:
-                output_options["c:a"] = "aac"
-                # Bitrate
-                bitrate = settings.get("bitrate", "128k")
-                if bitrate != "Auto":
-                    output_options["b:a"] = bitrate
-                # Sample rate
-                sample_rate = settings.get("sample_rate")
-                if sample_rate and sample_rate != "Auto":
-                    output_options["ar"] = sample_rate
-        else:
-            # Default audio settings
-            output_options["c:a"] = "aac"
-            output_options["b:a"] = "128k"
-
-        # Create the ffmpeg command with explicit stream handling
-        # We'll use the global_args method to add the mapping options
-        ffmpeg_cmd = (
-            ffmpeg.input(concat_file, format="concat", safe=0)
-            .output(output_file, **output_options)
-            .global_args(
-                "-i",
-                chapter_file,  # Add chapter file as second input
-                "-map",
-                "0:a",  # Map audio from first input
-                "-map_metadata",
-                "1",  # Map metadata from second input
-                "-progress",
-                "pipe:1",  # For progress monitoring
+                final_start = ENCODE_PROGRESS
+
+                # Source lengths can be bitrate estimates and encoding pads the
+                # last frame, so place chapters and files by the intermediates,
+                # whose MP4 lengths are exact
+                encoded_cache = probe_files(concat_inputs)
+                durations = [encoded_cache[f]["duration"] for f in concat_inputs]
+                probe_cache = {
+                    src: {**probe_cache[src], "duration": duration}
+                    for src, duration in zip(input_files, durations)
+                }
+
+            chapter_file = create_chapter_metadata(
+                input_files, chapter_titles, probe_cache, work_dir
             )
-            .overwrite_output()
-        )
 
-        # Get the command that would be executed for logging
-        cmd_args = ffmpeg_cmd.compile()
-        logging.info(f"Executing FFmpeg command: {' '.join(cmd_args)}")
+            # The concat list goes through ffmpeg's stdin. Intermediates get
+            # duration directives matching the chapter marks, copied sources
+            # are left to their own timestamps
+            concat_list = build_concat_list(concat_inputs, durations)
+
+            cmd_args = build_ffmpeg_cmd(
+                [
+                    (
+                        "pipe:0",
+                        {
+                            "f": "concat",
+                            "safe": 0,
+                            # Reading the list from a pipe, the listed files
+                            # need "file" too
+                            "protocol_whitelist": "file,pipe",
+                        },
+                    ),
+                    (chapter_file, {}),
+                ],
+                output_file,
+                {
+                    "map": "0:a",  # Map audio from first input
+                    "map_metadata": 1,  # Map metadata from the chapter file
+                    "c:a": "copy",
+                },
+                # Machine readable progress on stdout instead of stats on stderr
+                ["-progress", "pipe:1", "-nostats", "-v", "warning"],
+            )
+            logging.info("Executing FFmpeg command: %s", " ".join(cmd_args))
+
+            # Run FFmpeg
+            process = subprocess.Popen(
+                cmd_args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
-        # Run FFmpeg
-        try:
-            # Run the ffmpeg process
-            process = ffmpeg_cmd.run_async(pipe_stdout=True, pipe_stderr=True)
+            # Keep stderr drained so ffmpeg never blocks on a full pipe
+            stderr_lines = deque(maxlen=50)
+            stderr_thread = threading.Thread(
+                target=drain_stream,
+                args=(process.stderr, stderr_lines),
+                daemon=True,
+            )
+            stderr_thread.start()
 
-            # Monitor progress
-            while True:
+            # ffmpeg reads the whole list when opening the input, before encoding.
+            # If it exits first, the return code check below reports its stderr
+            try:
+                process.stdin.write(concat_list.encode("utf-8"))
+            except BrokenPipeError:
+                pass
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+
+            # Monitor progress, ffmpeg writes a block of key=value lines about
+            # twice a second, each block ending with a "progress" key
+            total_us = sum(probe_cache[f]["duration"] for f in input_files) * 1e6
+            progress = {}
+            last_percent = -1
+            for line in iter(process.stdout.readline, b""):
                 if stop_event and stop_event():
                     process.terminate()
                     process.wait()
                     raise RuntimeError("Conversion stopped by user")
 
-                # Read output line by line
-                line = process.stderr.readline().decode("utf-8", errors="replace")
-                if not line and process.poll() is not None:
-                    break
-                if line:
-                    logging.info(line.strip())
+                key, _, value = line.decode("ascii", errors="replace").partition("=")
+                progress[key] = value.strip()
+                if key != "progress":
+                    continue
+
+                # out_time_ms is in microseconds too, older ffmpeg lacks out_time_us
+                out_time = progress.get("out_time_us", progress.get("out_time_ms"))
+                if not out_time or not out_time.lstrip("-").isdigit() or not total_us:
+                    continue
+                percent = max(0, min(100, int(int(out_time) * 100 / total_us)))
+                if percent != last_percent:
+                    last_percent = percent
+                    logging.info(
+                        "Progress: %d%% (speed %s)", percent, progress.get("speed")
+                    )
+                    if progress_callback:
+                        progress_callback(
+                            final_start + percent * (100 - final_start) // 100
+                        )
 
             # Wait for process to complete
             process.wait()
+            stderr_thread.join()
 
+            stderr = "\n".join(stderr_lines)
             if process.returncode != 0:
-                stderr = process.stderr.read().decode("utf-8", errors="replace")
                 raise RuntimeError(f"FFmpeg error: {stderr}")
-
-        except ffmpeg.Error as e:
-            stderr = e.stderr.decode("utf-8", errors="replace") if e.stderr else str(e)
-            raise RuntimeError(f"FFmpeg error: {stderr}")
-
-        # Add metadata if provided
-        if metadata:
-            try:
-                audio = MP4(output_file)
-
-                # Add each metadata field
-                for key, value in metadata.items():
-                    if key == "cover_path" and value:
-                        try:
-                            with open(value, "rb") as f:
-                                cover_data = f.read()
-                            audio["covr"] = [MP4Cover(cover_data)]
-                        except Exception as e:
-                            logging.error(f"Error adding cover art: {str(e)}")
-                    elif value:  # Only add non-empty values
-                        audio[key] = value
-
-                # Save changes
-                audio.save()
-                logging.info("Metadata added successfully")
-
-            except Exception as e:
-                logging.error(f"Error adding metadata: {str(e)}")
-                raise
-
-        logging.info("Conversion completed successfully!")
+            if stderr:
+                logging.info(stderr)
+
+            # Add metadata if provided
+            if metadata:
+                try:
+                    audio = MP4(output_file)
+
+                    # Add each metadata field
+                    for key, value in metadata.items():
+                        if key == "cover_path" and value:
+                            try:
+                                with open(value, "rb") as f:
+                                    cover_data = f.read()
+                                audio["covr"] = [MP4Cover(cover_data)]
+                            except Exception as e:
+                                logging.error("Error adding cover art: %s", e)
+                        elif value:  # Only add non-empty values
+                            audio[key] = value
+
+                    # Save changes
+                    audio.save()
+                    logging.info("Metadata added successfully")
+
+                except Exception as e:
+                    logging.error("Error adding metadata: %s", e)
+                    raise
+
+            logging.info("Conversion completed successfully!")
 
     except Exception as e:
-        logging.error(f"Error during conversion: {str(e)}")
+        logging.error("Error during conversion: %s", e)
         raise
-
-    finally:
-        # Clean up temporary files
-        for temp_file in temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except OSError:
-                pass  # Ignore cleanup errors
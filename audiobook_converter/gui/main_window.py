@@ -1,9 +1,8 @@
-import re
+import os
 import logging
-import requests
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlparse
 
 
 from PyQt6.QtWidgets import (
@@ -22,6 +21,7 @@ from PyQt6.QtWidgets import (
   QFormLayout,
   QComboBox,
   QCheckBox,
+  QSpinBox,
   QListWidgetItem,
   QMenu,
   QStyledItemDelegate,
@@ -32,21 +32,56 @@ from PyQt6.QtWidgets import (
   QMessageBox,
   QInputDialog,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QRectF
-from PyQt6.QtGui import QPixmap, QColor, QTextDocument, QIcon, QImageReader
+from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QTimer, QThreadPool
+from PyQt6.QtGui import (
+  QPixmap,
+  QPixmapCache,
+  QColor,
+  QTextDocument,
+  QIcon,
+  QImageReader,
+)
 
 from audiobook_converter.core.converter import ConversionThread
 from audiobook_converter.utils.logging import setup_logging
-from audiobook_converter.core.m4b_generator import get_audio_title, process_audio_files
-from audiobook_converter.core.book_api import search_google_books
+from audiobook_converter.core.m4b_generator import (
+  Codec,
+  get_audio_title,
+  process_audio_files,
+)
+from audiobook_converter.core.book_api import (
+  HTTP_TIMEOUT,
+  clear_search_cache,
+  get_http_session,
+)
+from audiobook_converter.core.book_fetcher import BookFetchWorker
 from audiobook_converter.regex import (
+  PreviewThread,
   RegexPatternWidget,
   RegexListWidget,
-  apply_single_pattern,
-  process_replacement_text,
-  format_number,
+  apply_patterns,
+  build_preview,
 )
 
+# Chapter count from which the preview is computed on a worker thread
+PREVIEW_THREAD_THRESHOLD = 200
+
+
+@lru_cache(maxsize=128)
+def _ext_from_url(url: str) -> str:
+  """Return the file extension of a URL's path, or "" if it has none."""
+  # Drop query string and fragment
+  for sep in ("?", "#"):
+    i = url.find(sep)
+    if i >= 0:
+      url = url[:i]
+  # Skip the scheme and host so a bare domain isn't read as a file name
+  i = url.find("://")
+  if i >= 0:
+    j = url.find("/", i + 3)
+    url = url[j:] if j >= 0 else ""
+  return os.path.splitext(url[url.rfind("/") + 1 :])[1]
+
 
 class HTMLDelegate(QStyledItemDelegate):
   def __init__(self, parent=None):
@@ -75,6 +110,73 @@ class HTMLDelegate(QStyledItemDelegate):
       super().paint(painter, options, index)
 
 
+def _relative_to_cwd(path: str) -> str:
+  """Return path relative to the working directory if it lies inside it."""
+  cwd = os.getcwd()
+  # relpath can't bridge Windows drives, keep such paths absolute
+  if os.path.splitdrive(path)[0].lower() != os.path.splitdrive(cwd)[0].lower():
+    return path
+  rel_path = os.path.relpath(path, cwd)
+  if rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep):
+    return path
+  return rel_path
+
+
+def _cached_pixmap(key: str, load) -> QPixmap:
+  """Return the pixmap cached under key, creating it with load() on a miss."""
+  pixmap = QPixmapCache.find(key)
+  if pixmap is None or pixmap.isNull():
+    pixmap = load()
+    QPixmapCache.insert(key, pixmap)
+  return pixmap
+
+
+class ImagePopout(QMainWindow):
+  """Window showing a cover image scaled to fit its size."""
+
+  def __init__(self, pixmap, cache_key, parent=None):
+    super().__init__(parent)
+    self.setWindowTitle("Cover Image")
+    self.setMinimumSize(600, 600)
+    self._pixmap = pixmap
+    self._cache_key = cache_key  # Identifies the image in QPixmapCache
+
+    self._label = QLabel(self)
+    self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    self._label.setMinimumSize(1, 1)  # Let the window shrink below the pixmap
+    self.setCentralWidget(self._label)
+
+    # Rescale with full quality once interactive resizing pauses
+    self._smooth_timer = QTimer(self)
+    self._smooth_timer.setSingleShot(True)
+    self._smooth_timer.setInterval(150)
+    self._smooth_timer.timeout.connect(
+      lambda: self._render(Qt.TransformationMode.SmoothTransformation)
+    )
+
+  def _render(self, mode):
+    size = self._label.size()
+
+    def scale():
+      return self._pixmap.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, mode)
+
+    if mode == Qt.TransformationMode.SmoothTransformation:
+      # Reuse final-quality renders across resizes and popouts
+      key = f"{self._cache_key}@{size.width()}x{size.height()}"
+      self._label.setPixmap(_cached_pixmap(key, scale))
+    else:
+      self._label.setPixmap(scale())
+
+  def resizeEvent(self, event):
+    super().resizeEvent(event)
+    if not self.isVisible():
+      # Initial layout, render the final quality straight away
+      self._render(Qt.TransformationMode.SmoothTransformation)
+      return
+    self._render(Qt.TransformationMode.FastTransformation)
+    self._smooth_timer.start()
+
+
 class AudiobookConverterGUI(QMainWindow):
   log_signal = pyqtSignal(str)
 
@@ -90,9 +192,21 @@ class AudiobookConverterGUI(QMainWindow):
     self.original_titles = []  # Initialize original_titles list
     self.cover_image_path = None
     self.conversion_thread = None
-    self.edited_titles = {}  # Change to dict to store original->edited mapping
+    self.edited_titles = {}  # Row index -> edited title, for changed rows
     self.is_editing = False  # Track if we're currently editing
-    self._edit_handler_connected = False  # Track signal connection state
+    self._cover_menu = None  # Built lazily on first cover selection
+    self._cover_pixmap = None  # (cache key, decoded cover) of the last cover shown
+    self._http = get_http_session()  # Pooled session shared with book_api
+    self._last_preview_html = []  # Text currently shown in each preview row
+    self._fetch_worker = None  # Book metadata search in flight, if any
+    self._preview_thread = None  # Latest background preview, if any
+    self._preview_is_rich = True  # False if built while the list was hidden
+
+    # Coalesce bursts of pattern edits into a single preview update
+    self._preview_timer = QTimer(self)
+    self._preview_timer.setSingleShot(True)
+    self._preview_timer.setInterval(150)
+    self._preview_timer.timeout.connect(self.update_chapter_preview)
 
     # Dictionary to store splitters for each tab
     self.tab_splitters = {}
@@ -123,6 +237,7 @@ class AudiobookConverterGUI(QMainWindow):
     self.tabs = QTabWidget()
     self.tabs.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     self.tabs.customContextMenuRequested.connect(self.show_tab_context_menu)
+    self.tabs.currentChanged.connect(self._on_tab_changed)
     upper_layout.addWidget(self.tabs)
 
     # Create individual tabs
@@ -179,8 +294,20 @@ class AudiobookConverterGUI(QMainWindow):
     self.tab_splitters["main"] = [(self.main_splitter, [800, 200])]
 
     # Set up logging
-    setup_logging(self.log_signal)
     self.log_signal.connect(self.update_log)
+    self._log_listener = setup_logging(self.log_signal)
+
+  def closeEvent(self, event):
+    # Let background previews finish before their parent goes away
+    for thread in self.findChildren(PreviewThread):
+      thread.requestInterruption()
+      thread.wait()
+    # Flush pending log records and stop the listener thread
+    self._log_listener.stop()
+    for handler in self._log_listener.handlers:
+      handler.flush_timer.stop()
+      handler.flush()
+    super().closeEvent(event)
 
   def create_main_tab(self):
     main_tab = QWidget()
@@ -275,8 +402,12 @@ class AudiobookConverterGUI(QMainWindow):
     self.preview_titles.setSizePolicy(
       QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
     )
-    self.preview_titles.setItemDelegate(HTMLDelegate(self.preview_titles))
+    title_delegate = HTMLDelegate(self.preview_titles)
+    # Esc closes the editor without itemChanged, so leave edit mode here too
+    title_delegate.closeEditor.connect(self.end_title_edit)
+    self.preview_titles.setItemDelegate(title_delegate)
     self.preview_titles.itemDoubleClicked.connect(self.edit_title)
+    self.preview_titles.itemChanged.connect(self.handle_title_edit)
     self.preview_titles.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     self.preview_titles.customContextMenuRequested.connect(self.show_context_menu)
     preview_layout.addWidget(self.preview_titles)
@@ -303,6 +434,7 @@ class AudiobookConverterGUI(QMainWindow):
 
     # List widget for patterns
     self.patterns_list = RegexListWidget()
+    self.patterns_list.patternEdited.connect(self._preview_timer.start)
     self.patterns_list.patternsChanged.connect(self.update_chapter_preview)
     regex_layout.addWidget(self.patterns_list)
 
@@ -350,16 +482,19 @@ class AudiobookConverterGUI(QMainWindow):
     self.metadata_genre = QLineEdit()
     self.metadata_year = QLineEdit()
 
+    # Line edits paired with the metadata key they hold
+    self._metadata_field_map = (
+      (self.metadata_title, "title"),
+      (self.metadata_author, "artist"),
+      (self.metadata_narrator, "album_artist"),
+      (self.metadata_series, "album"),
+      (self.metadata_series_index, "track"),
+      (self.metadata_genre, "genre"),
+      (self.metadata_year, "date"),
+    )
+
     # Set size policies and placeholders
-    for widget in [
-      self.metadata_title,
-      self.metadata_author,
-      self.metadata_narrator,
-      self.metadata_series,
-      self.metadata_series_index,
-      self.metadata_genre,
-      self.metadata_year,
-    ]:
+    for widget, _ in self._metadata_field_map:
       try:
         widget.setSizePolicy(
           QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
@@ -384,10 +519,16 @@ class AudiobookConverterGUI(QMainWindow):
     title_layout = QHBoxLayout()
     title_layout.setContentsMargins(0, 0, 0, 0)
     title_layout.addWidget(self.metadata_title)
-    quick_match_button = QPushButton("Search")
-    quick_match_button.setFixedWidth(100)
-    quick_match_button.clicked.connect(self.fetch_book_metadata)
-    title_layout.addWidget(quick_match_button)
+    self.search_button = QPushButton("Search")
+    self.search_button.setFixedWidth(100)
+    self.search_button.clicked.connect(self.fetch_book_metadata)
+    self.search_button.setContextMenuPolicy(
+      Qt.ContextMenuPolicy.CustomContextMenu
+    )
+    self.search_button.customContextMenuRequested.connect(
+      self.show_search_context_menu
+    )
+    title_layout.addWidget(self.search_button)
 
     # Add fields with labels
     try:
@@ -502,32 +643,24 @@ class AudiobookConverterGUI(QMainWindow):
 
     # Audio codec selection
     self.codec_combo = QComboBox()
-    self.codec_combo.addItems(["Auto (Copy if possible)", "AAC", "AAC-LC"])
+    self.codec_combo.addItem("Auto (Copy if possible)", Codec.AUTO)
+    self.codec_combo.addItem("AAC", Codec.AAC)
+    self.codec_combo.addItem("AAC-LC", Codec.AAC_LC)
     form_layout.addRow("Audio Codec:", self.codec_combo)
 
-    # Bitrate selection
+    # Bitrate selection (kbps, 0 means Auto)
     self.bitrate_combo = QComboBox()
-    self.bitrate_combo.addItems(
-      [
-        "Auto",
-        "16k",
-        "32k",
-        "64k",
-        "96k",
-        "128k",
-        "192k",
-        "256k",
-        "320k",
-      ]
-    )
+    self.bitrate_combo.addItem("Auto", 0)
+    for kbps in [16, 32, 64, 96, 128, 192, 256, 320]:
+      self.bitrate_combo.addItem(f"{kbps}k", kbps)
     self.bitrate_combo.setCurrentText("Auto")
     form_layout.addRow("Bitrate:", self.bitrate_combo)
 
-    # Sample rate selection
+    # Sample rate selection (Hz, 0 means Auto)
     self.sample_rate_combo = QComboBox()
-    self.sample_rate_combo.addItems(
-      ["Auto", "22050", "44100", "48000", "96000", "192000"]
-    )
+    self.sample_rate_combo.addItem("Auto", 0)
+    for hz in [22050, 44100, 48000, 96000, 192000]:
+      self.sample_rate_combo.addItem(str(hz), hz)
     form_layout.addRow("Sample Rate:", self.sample_rate_combo)
 
     # Force conversion checkbox
@@ -535,6 +668,12 @@ class AudiobookConverterGUI(QMainWindow):
     self.force_conversion.setChecked(False)
     form_layout.addRow(self.force_conversion)
 
+    # Number of files encoded at once when converting
+    self.jobs_spin = QSpinBox()
+    self.jobs_spin.setRange(1, os.cpu_count() or 1)
+    self.jobs_spin.setValue(os.cpu_count() or 1)
+    form_layout.addRow("Parallel Jobs:", self.jobs_spin)
+
     settings_layout.addLayout(form_layout)
     settings_layout.addStretch()
     splitter.addWidget(settings_widget)
@@ -580,82 +719,18 @@ class AudiobookConverterGUI(QMainWindow):
         " ".join(query_parts) + " -summary -quicklet -cliffnotes -study guide"
       )
 
-      # Get all matching books
-      all_metadata = search_google_books(query, multiple=True)
-      if not all_metadata:
-        QMessageBox.warning(self, "Warning", "No matching book found.")
-        return
-
-      # Filter out summaries/study guides
-      valid_books = [
-        book
-        for book in all_metadata
-        if not any(
-          x in book.get("title", "").lower()
-          for x in ["summary", "quicklet", "cliffnotes", "study guide"]
-        )
-      ]
-
-      if not valid_books:
-        QMessageBox.warning(
-          self,
-          "Warning",
-          "Found only summaries/study guides. Please try adding the author name if not specified.",
-        )
-        return
+      # Search and download the cover in the background
+      self._fetch_worker = BookFetchWorker(query)
+      signals = self._fetch_worker.signals
+      signals.metadata_ready.connect(self._apply_metadata)
+      signals.cover_ready.connect(self._ingest_cover_bytes)
+      signals.warning.connect(self._on_fetch_warning)
+      signals.error.connect(self._on_fetch_error)
+      signals.finished.connect(self._on_fetch_finished)
 
-      # Sort by publication date (ascending) to get the earliest edition first
-      valid_books.sort(
-        key=lambda x: x.get("date", "9999")
-      )  # Default to far future if no date
-
-      # Iterate through valid books to find a cover image
-      for metadata in valid_books:
-        # Update metadata fields with proper error handling
-        if not self.metadata_title.text():
-          self.metadata_title.setText(metadata.get("title", ""))
-        if not self.metadata_author.text():
-          self.metadata_author.setText(metadata.get("artist", ""))
-        if not self.metadata_narrator.text():
-          self.metadata_narrator.setText(metadata.get("album_artist", ""))
-        if not self.metadata_series.text():
-          self.metadata_series.setText(metadata.get("album", ""))
-        if not self.metadata_series_index.text():
-          self.metadata_series_index.setText(metadata.get("track", ""))
-        if not self.metadata_genre.text():
-          self.metadata_genre.setText(metadata.get("genre", ""))
-        if not self.metadata_year.text():
-          self.metadata_year.setText(metadata.get("date", ""))
-        if not self.metadata_description.toPlainText():
-          self.metadata_description.setText(metadata.get("description", ""))
-
-        # Handle cover image if available
-        if "cover_url" in metadata and metadata["cover_url"]:
-          try:
-            # Download the cover image
-            response = requests.get(metadata["cover_url"])
-            response.raise_for_status()
-
-            # Create a temporary file for the image with proper extension
-            url_path = urlparse(metadata["cover_url"]).path
-            ext = Path(url_path).suffix or ".jpg"
-
-            with tempfile.NamedTemporaryFile(
-              delete=False, suffix=ext
-            ) as tmp_file:
-              tmp_file.write(response.content)
-              self.cover_image_path = tmp_file.name
-
-            self.update_cover_preview()
-            logging.info("Cover image downloaded successfully")
-            break  # Exit the loop if a cover image is found
-
-          except Exception as e:
-            logging.error(f"Error downloading cover image: {str(e)}")
-            self.clear_cover_image()
-
-      if not self.cover_image_path:
-        logging.warning("No cover image found")
+      # Prevent duplicate searches while this one is in flight
+      self.search_button.setEnabled(False)
+      QThreadPool.globalInstance().start(self._fetch_worker)
 
     except Exception as e:
       logging.error(f"Error fetching book metadata: {str(e)}")
@@ -663,16 +738,62 @@ class AudiobookConverterGUI(QMainWindow):
         self, "Error", f"Failed to fetch book metadata: {str(e)}"
       )
 
+  def _apply_metadata(self, metadata):
+    # Only fill fields the user hasn't filled yet
+    for widget, key in self._metadata_field_map:
+      if not widget.text():
+        widget.setText(metadata.get(key, ""))
+    if not self.metadata_description.toPlainText():
+      self.metadata_description.setText(metadata.get("description", ""))
+
+  def _ingest_cover_bytes(self, data, cover_url):
+    try:
+      # Create a temporary file for the image with proper extension
+      ext = _ext_from_url(cover_url) or ".jpg"
+
+      with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as tmp_file:
+        tmp_file.write(data)
+        self.cover_image_path = tmp_file.name
+
+      self.update_cover_preview()
+      logging.info("Cover image downloaded successfully")
+
+    except Exception as e:
+      logging.error(f"Error saving cover image: {str(e)}")
+      self.clear_cover_image()
+
+  def _on_fetch_warning(self, message):
+    QMessageBox.warning(self, "Warning", message)
+
+  def _on_fetch_error(self, message):
+    QMessageBox.warning(self, "Error", f"Failed to fetch book metadata: {message}")
+
+  def _on_fetch_finished(self):
+    self._fetch_worker = None
+    self.search_button.setEnabled(True)
+
+  def show_search_context_menu(self, position):
+    menu = QMenu()
+    clear_action = menu.addAction("Clear Metadata Cache")
+    action = menu.exec(self.search_button.mapToGlobal(position))
+
+    if action == clear_action:
+      clear_search_cache()
+      logging.info("Metadata search cache cleared")
+
   def select_cover_image(self):
-    # Create a menu with options
-    menu = QMenu(self)
-    local_action = menu.addAction("Select Local File")
-    url_action = menu.addAction("Enter URL")
+    # Build the options menu once and reuse it on later clicks
+    if self._cover_menu is None:
+      self._cover_menu = QMenu(self)
+      self._local_action = self._cover_menu.addAction("Select Local File")
+      self._url_action = self._cover_menu.addAction("Enter URL")
 
     # Show menu at the button's position
-    action = menu.exec(self.sender().mapToGlobal(self.sender().rect().bottomLeft()))
+    action = self._cover_menu.exec(
+      self.sender().mapToGlobal(self.sender().rect().bottomLeft())
+    )
 
-    if action == local_action:
+    if action == self._local_action:
       # Handle local file selection
       file_name, _ = QFileDialog.getOpenFileName(
         self,
@@ -681,15 +802,10 @@ class AudiobookConverterGUI(QMainWindow):
         "Image Files (*.png *.jpg *.jpeg);;All Files (*.*)",
       )
       if file_name:
-        try:
-          rel_path = str(Path(file_name).relative_to(Path.cwd()))
-          self.cover_image_path = rel_path
-          self.update_cover_preview()
-        except ValueError:
-          self.cover_image_path = file_name
-          self.update_cover_preview()
+        self.cover_image_path = _relative_to_cwd(file_name)
+        self.update_cover_preview()
 
-    elif action == url_action:
+    elif action == self._url_action:
       # Handle URL input
       url, ok = QInputDialog.getText(
         self,
@@ -700,12 +816,11 @@ class AudiobookConverterGUI(QMainWindow):
       if ok and url:
         try:
           # Download the image
-          response = requests.get(url)
+          response = self._http.get(url, timeout=HTTP_TIMEOUT)
           response.raise_for_status()
 
           # Get file extension from URL or default to .jpg
-          url_path = urlparse(url).path
-          ext = Path(url_path).suffix
+          ext = _ext_from_url(url)
           if not ext:
             # Try to determine format from content type
             content_type = response.headers.get("content-type", "")
@@ -734,6 +849,7 @@ class AudiobookConverterGUI(QMainWindow):
 
   def clear_cover_image(self):
     self.cover_image_path = None
+    self._cover_pixmap = None
     self.cover_image_label.setText("No image selected")
     self.cover_image_label.setPixmap(QPixmap())
 
@@ -742,7 +858,7 @@ class AudiobookConverterGUI(QMainWindow):
       self.image_info_label.setText("")
       return
 
-    pixmap = QPixmap(self.cover_image_path)
+    pixmap = self._load_cover_pixmap(self._cover_cache_key())
     scaled_pixmap = pixmap.scaled(
       self.cover_image_label.size(),
       Qt.AspectRatioMode.KeepAspectRatio,
@@ -767,17 +883,24 @@ class AudiobookConverterGUI(QMainWindow):
       f"Type: {image_type}"
     )
 
+  def _cover_cache_key(self) -> str:
+    # Include the modification time so edited files are decoded again
+    mtime = Path(self.cover_image_path).stat().st_mtime_ns
+    return f"cover:{self.cover_image_path}:{mtime}"
+
+  def _load_cover_pixmap(self, cache_key: str) -> QPixmap:
+    """Decode the cover image once per file version and reuse it.
+
+    Full-size covers can be larger than QPixmapCache's limit, so the decoded
+    image is kept here and only scaled copies go into the cache.
+    """
+    if self._cover_pixmap is None or self._cover_pixmap[0] != cache_key:
+      self._cover_pixmap = (cache_key, QPixmap(self.cover_image_path))
+    return self._cover_pixmap[1]
+
   def get_metadata(self):
-    metadata = {
-      "title": self.metadata_title.text(),
-      "artist": self.metadata_author.text(),
-      "album_artist": self.metadata_narrator.text(),
-      "album": self.metadata_series.text(),
-      "track": self.metadata_series_index.text(),
-      "genre": self.metadata_genre.text(),
-      "date": self.metadata_year.text(),
-      "description": self.metadata_description.toPlainText(),
-    }
+    metadata = {key: widget.text() for widget, key in self._metadata_field_map}
+    metadata["description"] = self.metadata_description.toPlainText()
 
     if self.cover_image_path:
       metadata["cover_path"] = self.cover_image_path
@@ -786,10 +909,11 @@ class AudiobookConverterGUI(QMainWindow):
 
   def get_conversion_settings(self):
     return {
-      "codec": self.codec_combo.currentText(),
-      "bitrate": self.bitrate_combo.currentText(),
-      "sample_rate": self.sample_rate_combo.currentText(),
+      "codec": self.codec_combo.currentData(),
+      "bitrate": self.bitrate_combo.currentData(),
+      "sample_rate": self.sample_rate_combo.currentData(),
       "force_conversion": self.force_conversion.isChecked(),
+      "jobs": self.jobs_spin.value(),
     }
 
   def update_log(self, message):
@@ -798,11 +922,7 @@ class AudiobookConverterGUI(QMainWindow):
   def select_input_directory(self):
     directory = QFileDialog.getExistingDirectory(self, "Select Input Directory")
     if directory:
-      try:
-        rel_path = str(Path(directory).relative_to(Path.cwd()))
-        self.input_path.setText(rel_path)
-      except ValueError:
-        self.input_path.setText(directory)
+      self.input_path.setText(_relative_to_cwd(directory))
 
   def select_output_file(self):
     file_name, _ = QFileDialog.getSaveFileName(
@@ -811,11 +931,7 @@ class AudiobookConverterGUI(QMainWindow):
     if file_name:
       if not file_name.lower().endswith(".m4b"):
         file_name += ".m4b"
-      try:
-        rel_path = str(Path(file_name).relative_to(Path.cwd()))
-        self.output_path.setText(rel_path)
-      except ValueError:
-        self.output_path.setText(file_name)
+      self.output_path.setText(_relative_to_cwd(file_name))
 
   def handle_convert_stop(self):
     if self.conversion_thread and self.conversion_thread.isRunning():
@@ -835,10 +951,13 @@ class AudiobookConverterGUI(QMainWindow):
       logging.error("Please select both input directory and output file")
       return
 
-    input_dir = str(Path(input_dir).absolute())
-    output_file = str(Path(output_file).absolute())
+    # Resolve relative paths against the working directory, looked up once
+    cwd = Path.cwd()
+    input_path = cwd / input_dir
+    input_dir = str(input_path)
+    output_file = str(cwd / output_file)
 
-    if not Path(input_dir).is_dir():
+    if not input_path.is_dir():
       logging.error("Invalid input directory")
       return
 
@@ -849,53 +968,17 @@ class AudiobookConverterGUI(QMainWindow):
 
     metadata = self.get_metadata()
     if metadata.get("cover_path"):
-      metadata["cover_path"] = str(Path(metadata["cover_path"]).absolute())
+      metadata["cover_path"] = str(cwd / metadata["cover_path"])
 
     settings = self.get_conversion_settings()
 
-    # Get edited chapter titles after all regex patterns
-    chapter_titles = []
-    patterns = self.patterns_list.get_regex_patterns()
-    global_counter = 1
-
-    for i, original_title in enumerate(self.original_titles):
-      current_title = original_title
-      # Apply each pattern in sequence
-      for pattern_text, replacement_text in patterns:
-        if not pattern_text:  # Skip empty patterns
-          continue
-        try:
-          pattern = re.compile(pattern_text)
-          if pattern.search(current_title):
-            # Find all {n} patterns in replacement text
-            n_pattern = re.compile(r"\{n+(?:\+\d+)?\}")
-            actual_replacement = replacement_text
-
-            for n_match in n_pattern.finditer(replacement_text):
-              try:
-                n_pattern_text = n_match.group(0)[
-                  1:-1
-                ]  # Remove { and }
-                formatted_num = format_number(
-                  global_counter - 1, n_pattern_text
-                )
-                actual_replacement = actual_replacement.replace(
-                  n_match.group(0), formatted_num
-                )
-              except Exception as e:
-                logging.error(f"Error formatting number: {str(e)}")
-                continue
-
-            # Apply the replacement
-            current_title = pattern.sub(actual_replacement, current_title)
-        except re.error as e:
-          logging.error(f"Invalid regex pattern: {str(e)}")
-          continue
-        except Exception as e:
-          logging.error(f"Error applying pattern: {str(e)}")
-          continue
-      chapter_titles.append(current_title)
-      global_counter += 1
+    # Get edited chapter titles after all regex patterns, using the same
+    # pipeline as the preview so the file matches what the user saw
+    compiled_patterns = self.patterns_list.get_compiled_patterns()
+    chapter_titles = [
+      apply_patterns(title, compiled_patterns, global_counter, want_rich=False)[0]
+      for global_counter, title in enumerate(self.original_titles, start=1)
+    ]
 
     self.conversion_thread = ConversionThread(
       input_dir, output_file, metadata, settings, chapter_titles
@@ -903,8 +986,14 @@ class AudiobookConverterGUI(QMainWindow):
     self.conversion_thread.finished.connect(self.conversion_finished)
     self.conversion_thread.stopped.connect(self.conversion_stopped)
     self.conversion_thread.error.connect(self.conversion_error)
+    self.conversion_thread.progress.connect(self.conversion_progress)
     self.conversion_thread.start()
 
+  def conversion_progress(self, percent):
+    # Switch from the busy indicator to a percentage once ffmpeg reports one
+    self.progress_bar.setRange(0, 100)
+    self.progress_bar.setValue(percent)
+
   def conversion_stopped(self):
     self.progress_bar.setVisible(False)
     self.convert_stop_button.setEnabled(True)
@@ -928,20 +1017,23 @@ class AudiobookConverterGUI(QMainWindow):
     if not input_dir:
       return
 
-    abs_input_dir = str(Path(input_dir).absolute())
-    if not Path(abs_input_dir).is_dir():
+    abs_input_dir = Path(input_dir).absolute()
+    if not abs_input_dir.is_dir():
       return
 
     try:
-      self.chapter_files = process_audio_files(abs_input_dir, False)
-      self.original_titles = []  # Store original titles in a list
-      self.preview_titles.clear()
+      self.chapter_files = process_audio_files(str(abs_input_dir), False)
+      # Store original titles in a list
+      self.original_titles = [get_audio_title(file) for file in self.chapter_files]
 
-      for file in self.chapter_files:
-        title = get_audio_title(file)
-        self.original_titles.append(title)
-        item = QListWidgetItem(title)
-        self.preview_titles.addItem(item)
+      # Fill the list in one batch without repainting per row
+      self.preview_titles.setUpdatesEnabled(False)
+      try:
+        self.preview_titles.clear()
+        self.preview_titles.addItems(self.original_titles)
+      finally:
+        self.preview_titles.setUpdatesEnabled(True)
+      self._last_preview_html = list(self.original_titles)
 
       self.update_chapter_preview()
     except Exception as e:
@@ -951,43 +1043,34 @@ class AudiobookConverterGUI(QMainWindow):
     if self.is_editing:  # Prevent multiple edits at once
       return
 
-    self.is_editing = True
+    # Set the flag before entering edit mode, it emits itemChanged too
     item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-
-    # Only connect if not already connected
-    if not self._edit_handler_connected:
-      self.preview_titles.itemChanged.connect(self.handle_title_edit)
-      self._edit_handler_connected = True
+    self.is_editing = True
 
     self.preview_titles.editItem(item)
 
   def handle_title_edit(self, item):
     if not self.is_editing:  # Skip if we're not in edit mode
       return
+    # Leave edit mode first, the color changes below emit itemChanged again
+    self.is_editing = False
 
-    index = self.preview_titles.row(item)
-    original_title = self.original_titles[index]
-
-    # Store both original and edited title
-    self.edited_titles[item.text()] = original_title
+    # The original title stays available in self.original_titles
+    row = self.preview_titles.row(item)
+    self.edited_titles[row] = item.text()
+    # The next preview update rewrites this row like any changed one
+    self._last_preview_html[row] = None
 
     # Show both deletion and addition in the same item
     item.setBackground(QColor(230, 255, 237))  # Light green background
     item.setForeground(QColor(36, 41, 47))  # Dark gray text
 
-    # Only disconnect if connected
-    if self._edit_handler_connected:
-      try:
-        self.preview_titles.itemChanged.disconnect(self.handle_title_edit)
-      except TypeError:
-        pass  # Ignore if already disconnected
-      self._edit_handler_connected = False
-
+  def end_title_edit(self, editor, hint=None):
     self.is_editing = False
 
   def show_context_menu(self, position):
     item = self.preview_titles.itemAt(position)
-    if item and item.text() in self.edited_titles:
+    if item and self.preview_titles.row(item) in self.edited_titles:
       menu = QMenu()
       reset_action = menu.addAction("Reset to Original")
       action = menu.exec(self.preview_titles.mapToGlobal(position))
@@ -998,11 +1081,12 @@ class AudiobookConverterGUI(QMainWindow):
         # Get the original title
         original_title = self.original_titles[index]
         # Remove from edited titles
-        self.edited_titles.pop(item.text())
+        self.edited_titles.pop(index)
         # Reset the item with a new item to get default colors
         new_item = QListWidgetItem(original_title)
         self.preview_titles.takeItem(index)
         self.preview_titles.insertItem(index, new_item)
+        self._last_preview_html[index] = original_title
 
   def add_regex_pattern(self):
     self.patterns_list.add_pattern()
@@ -1023,92 +1107,114 @@ class AudiobookConverterGUI(QMainWindow):
     self.patterns_list.remove_pattern(item)
     self.update_chapter_preview()
 
-  def _process_single_title(
-    self, original_title: str, patterns: list[tuple[str, str]], global_counter: int
-  ) -> tuple[QListWidgetItem, int]:
-    """Process a single title with all regex patterns in sequence.
+  def _apply_preview(self, new_html: list[str]) -> None:
+    """Update only the preview rows whose text changed.
 
     Args:
-      original_title: Original chapter title
-      patterns: List of (pattern, replacement) tuples
-      global_counter: Current chapter counter
-
-    Returns:
-      Tuple of (QListWidgetItem, updated_counter)
+      new_html: Text (plain or rich) to show for every row
     """
-    try:
-      current_title = original_title
-      item = QListWidgetItem()
-      preview_segments = []  # Store rich text segments for each pattern
-
-      # Apply patterns in sequence
-      for pattern_text, replacement_text in patterns:
-        if not pattern_text:
-          continue
-
-        # Apply pattern and get both the new title and rich text preview
-        new_title, rich_text = apply_single_pattern(
-          current_title,
-          pattern_text,
-          replacement_text,
-          global_counter,
-        )
-
-        # Store rich text preview if pattern matched
-        if rich_text:
-          preview_segments.append(rich_text)
-
-        # Update current title for next pattern in sequence
-        current_title = new_title
-
-      # Set the final text and rich text preview
-      if preview_segments:
-        # Show the last preview that had changes
-        item.setText(preview_segments[-1])
-      else:
-        item.setText(current_title)
-
-      if current_title != original_title:
-        self.edited_titles[current_title] = original_title
+    old_html = self._last_preview_html
 
-      return item, global_counter + 1
-
-    except Exception as e:
-      logging.error(f"Error processing title: {str(e)}")
-      return QListWidgetItem(original_title), global_counter + 1
+    # Repaint once after all rows are updated, and keep setText from
+    # reaching handle_title_edit through itemChanged
+    self.preview_titles.setUpdatesEnabled(False)
+    self.preview_titles.blockSignals(True)
+    try:
+      for i, (old, new) in enumerate(zip(old_html, new_html)):
+        if old != new:
+          item = self.preview_titles.item(i)
+          item.setText(new)
+          # Drop the colors of a manual edit the new text replaces
+          item.setData(Qt.ItemDataRole.BackgroundRole, None)
+          item.setData(Qt.ItemDataRole.ForegroundRole, None)
+
+      # Drop surplus rows from the end, then append any new ones
+      for i in range(len(old_html) - 1, len(new_html) - 1, -1):
+        self.preview_titles.takeItem(i)
+      if len(new_html) > len(old_html):
+        self.preview_titles.addItems(new_html[len(old_html) :])
+    finally:
+      self.preview_titles.blockSignals(False)
+      self.preview_titles.setUpdatesEnabled(True)
+
+    self._last_preview_html = new_html
 
   def update_chapter_preview(self):
     """Update the chapter preview list with processed titles."""
+    # This update supersedes any pending debounced or background one
+    self._preview_timer.stop()
+    if self._preview_thread is not None:
+      self._preview_thread.requestInterruption()
+      self._preview_thread = None
     if not hasattr(self, "original_titles"):
       self.original_titles = []
 
     try:
-      patterns = self.patterns_list.get_regex_patterns()
-      self.preview_titles.clear()
+      # Compiled non-empty, valid patterns, cached on each pattern widget
+      patterns = self.patterns_list.get_compiled_patterns()
 
-      if not self.original_titles:
+      # If no usable patterns, show original titles
+      if not patterns:
+        self.edited_titles.clear()
+        self._apply_preview(list(self.original_titles))
         return
 
-      # If no patterns or all patterns are empty, show original titles
-      if not patterns or all(not pattern[0] for pattern in patterns):
-        for title in self.original_titles:
-          self.preview_titles.addItem(QListWidgetItem(title))
-        return
+      # Highlighting is only worth building if someone can see it
+      want_rich = self.preview_titles.isVisible()
+      self._preview_is_rich = want_rich
 
-      # Process each title with all patterns
-      global_counter = 1
-      for original_title in self.original_titles:
-        item, global_counter = self._process_single_title(
-          original_title, patterns, global_counter
+      # Keep the GUI responsive while processing long chapter lists
+      if len(self.original_titles) >= PREVIEW_THREAD_THRESHOLD:
+        thread = PreviewThread(self.original_titles, patterns, want_rich, self)
+        thread.ready.connect(
+          lambda results, thread=thread: self._on_preview_ready(thread, results)
         )
-        self.preview_titles.addItem(item)
+        thread.finished.connect(thread.deleteLater)
+        self._preview_thread = thread
+        thread.start()
+        return
+
+      self._show_preview_results(
+        build_preview(self.original_titles, patterns, want_rich=want_rich)
+      )
+
+    except Exception as e:
+      logging.error(f"Error updating chapter preview: {str(e)}")
+      self._restore_original_preview()
+
+  def _on_tab_changed(self, index):
+    # Add the highlighting skipped while the chapter list was hidden
+    if not self._preview_is_rich and self.preview_titles.isVisible():
+      self.update_chapter_preview()
 
+  def _on_preview_ready(self, thread, results):
+    # Ignore results from a preview that was superseded meanwhile
+    if thread is not self._preview_thread:
+      return
+    self._preview_thread = None
+    try:
+      self._show_preview_results(results)
     except Exception as e:
       logging.error(f"Error updating chapter preview: {str(e)}")
-      self.preview_titles.clear()
-      # Restore original titles
-      for title in self.original_titles:
-        self.preview_titles.addItem(QListWidgetItem(title))
+      self._restore_original_preview()
+
+  def _show_preview_results(self, results: list[tuple[str, str]]) -> None:
+    """Show (processed_title, preview_text) results in the preview list."""
+    # Recompute which rows differ from their original title
+    self.edited_titles.clear()
+    new_html = []
+    for index, (processed_title, preview_text) in enumerate(results):
+      new_html.append(preview_text)
+      if processed_title != self.original_titles[index]:
+        self.edited_titles[index] = processed_title
+
+    self._apply_preview(new_html)
+
+  def _restore_original_preview(self) -> None:
+    self.edited_titles.clear()
+    self.preview_titles.clear()
+    self._last_preview_html = []
+    self._apply_preview(list(self.original_titles))
 
   def show_tab_context_menu(self, position):
     # Get the tab under the cursor
@@ -1192,26 +1298,13 @@ class AudiobookConverterGUI(QMainWindow):
 
   def show_image_popout(self, event):
     if self.cover_image_path:
-      # Create a new window for the popout
-      popout_window = QMainWindow(self)
-      popout_window.setWindowTitle("Cover Image")
-      popout_window.setMinimumSize(600, 600)
-
-      # Create a label to display the image
-      popout_label = QLabel(popout_window)
-      popout_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-      # Load and scale the image
-      pixmap = QPixmap(self.cover_image_path)
-      scaled_pixmap = pixmap.scaled(
-        popout_window.size(),
-        Qt.AspectRatioMode.KeepAspectRatio,
-        Qt.TransformationMode.SmoothTransformation,
-      )
-      popout_label.setPixmap(scaled_pixmap)
-
-      # Set the label as the central widget
-      popout_window.setCentralWidget(popout_label)
+      try:
+        cache_key = self._cover_cache_key()
+      except OSError as e:
+        # The file was moved or deleted after it was selected
+        logging.error(f"Error opening cover image: {str(e)}")
+        return
 
-      # Show the popout window
+      # Create a new window for the popout and show it
+      popout_window = ImagePopout(self._load_cover_pixmap(cache_key), cache_key, self)
       popout_window.show()
@@ -1,10 +1,21 @@
-from .pattern import apply_single_pattern, process_replacement_text, format_number
+from .pattern import (
+  apply_patterns,
+  apply_single_pattern,
+  compile_pattern,
+  process_replacement_text,
+  format_number,
+)
+from .preview import PreviewThread, build_preview
 from .widgets import RegexPatternWidget, RegexListWidget
 
 __all__ = [
+  "apply_patterns",
   "apply_single_pattern",
+  "compile_pattern",
   "process_replacement_text",
   "format_number",
+  "build_preview",
+  "PreviewThread",
   "RegexPatternWidget",
   "RegexListWidget",
 ]
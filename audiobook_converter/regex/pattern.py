@@ -1,6 +1,31 @@
 import re
 import logging
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import List, Tuple, Optional, Union
+
+# Matches counter placeholders such as {n}, {nnn} or {nn+10}
+_N_PATTERN = re.compile(r"\{n+(?:\+\d+)?\}")
+
+# Rich text preview markup for replaced (green) and removed (red) text
+_ADDED_SPAN = '<span style="background-color: #E6FFE6; color: #28a745;">'
+_REMOVED_SPAN = '<span style="background-color: #FFE6E6; color: #FF0000;">'
+_SPAN_END = "</span>"
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern_text: str) -> re.Pattern:
+  """Compile a regex pattern, caching the result per pattern string."""
+  return re.compile(pattern_text)
+
+
+@lru_cache(maxsize=64)
+def _parse_number_pattern(pattern: str) -> Tuple[int, int]:
+  """Extract padding and start number from a pattern like 'nn+10'."""
+  padding = pattern.count("n")
+  start = 0
+  if "+" in pattern:
+    start = int(pattern.split("+")[1])
+  return padding, start
 
 
 def format_number(num: int, pattern: str) -> str:
@@ -13,13 +38,27 @@ def format_number(num: int, pattern: str) -> str:
   Returns:
     Formatted number string with proper padding and offset
   """
-  # Extract padding and start number from pattern
-  padding = pattern.count("n")
-  start = 0
-  if "+" in pattern:
-    start = int(pattern.split("+")[1])
-  num = num + start
-  return f"{num:0{padding}d}"
+  padding, start = _parse_number_pattern(pattern)
+  return f"{num + start:0{padding}d}"
+
+
+@lru_cache(maxsize=128)
+def _tokenize_replacement(
+  replacement_text: str,
+) -> Tuple[Union[str, Tuple[int, int]], ...]:
+  """Split replacement text into literal strings and (padding, start) tokens.
+
+  For example "Ch {nn+1}" becomes ("Ch ", (2, 1), "").
+  """
+  parts = []
+  last_end = 0
+  for n_match in _N_PATTERN.finditer(replacement_text):
+    parts.append(replacement_text[last_end : n_match.start()])
+    # Remove { and } before parsing the placeholder
+    parts.append(_parse_number_pattern(n_match.group(0)[1:-1]))
+    last_end = n_match.end()
+  parts.append(replacement_text[last_end:])
+  return tuple(parts)
 
 
 def process_replacement_text(replacement_text: str, global_counter: int) -> str:
@@ -33,76 +72,142 @@ def process_replacement_text(replacement_text: str, global_counter: int) -> str:
     Processed replacement text with {n} patterns replaced
   """
   try:
-    n_pattern = re.compile(r"\{n+(?:\+\d+)?\}")
-    actual_replacement = replacement_text
-
-    for n_match in n_pattern.finditer(replacement_text):
-      n_pattern_text = n_match.group(0)[1:-1]  # Remove { and }
-      formatted_num = format_number(global_counter - 1, n_pattern_text)
-      actual_replacement = actual_replacement.replace(
-        n_match.group(0), formatted_num
-      )
-
-    return actual_replacement
+    parts = _tokenize_replacement(replacement_text)
+    if len(parts) == 1 and isinstance(parts[0], str):
+      return replacement_text  # No {n} placeholders
+
+    num = global_counter - 1
+    return "".join(
+      part if isinstance(part, str) else f"{num + part[1]:0{part[0]}d}"
+      for part in parts
+    )
   except Exception as e:
     logging.error(f"Error processing replacement pattern: {str(e)}")
     return replacement_text
 
 
 def apply_single_pattern(
-  title: str, pattern_text: str, replacement_text: str, global_counter: int
+  title: str,
+  pattern_text: Union[str, re.Pattern],
+  replacement_text: str,
+  global_counter: int,
+  want_rich: bool = True,
 ) -> Tuple[str, str]:
   """Apply a single regex pattern to a title and generate rich text preview.
 
   Args:
     title: The title to process
-    pattern_text: The regex pattern to match
+    pattern_text: The regex pattern to match, as a string or precompiled
     replacement_text: The replacement text (may contain {n} placeholders)
     global_counter: Current chapter counter
+    want_rich: If False, skip building the rich text preview
 
   Returns:
-    Tuple of (processed_title, rich_text_preview)
+    Tuple of (processed_title, rich_text_preview), the preview is "" if
+    nothing matched or want_rich is False
   """
   try:
-    pattern = re.compile(pattern_text)
+    if isinstance(pattern_text, re.Pattern):
+      pattern = pattern_text
+    else:
+      pattern = compile_pattern(pattern_text)
     matches = list(pattern.finditer(title))
     if not matches:
       return title, ""
 
-    # First process the actual title replacement to get the new title
-    def replace_with_counter(m):
-      return process_replacement_text(replacement_text, global_counter)
-
-    if re.search(r"\{n+(?:\+\d+)?\}", replacement_text):
-      processed_title = pattern.sub(replace_with_counter, title)
-    else:
-      processed_title = pattern.sub(replacement_text, title)
-
-    # Then generate rich text preview showing the changes
-    rich_text = ""
+    # The counter is the same for every match, so expand {n} only once
+    actual_replacement = process_replacement_text(replacement_text, global_counter)
+    # Replacements with {n} are inserted literally, others may use backrefs
+    is_literal = actual_replacement != replacement_text
+
+    # The green span is the same for every match, so build it once
+    added_span = (
+      _ADDED_SPAN + actual_replacement + _SPAN_END if replacement_text else None
+    )
+
+    if not want_rich:
+      # Plain title only, no need to walk the matches for the preview
+      if is_literal:
+        return pattern.sub(lambda m: actual_replacement, title), ""
+      return pattern.sub(replacement_text, title), ""
+
+    # Build the new title and the rich text preview in a single pass
+    plain_parts = []
+    rich_parts = []
+    plain_append = plain_parts.append
+    rich_append = rich_parts.append
     last_end = 0
 
     for match in matches:
+      start, end = match.span()
       # Add text before match
-      rich_text += title[last_end : match.start()]
+      before = title[last_end:start]
+      plain_append(before)
+      rich_append(before)
+
+      if is_literal:
+        plain_append(actual_replacement)
+      else:
+        plain_append(match.expand(replacement_text))
 
-      if replacement_text:
-        actual_replacement = process_replacement_text(
-          replacement_text, global_counter
-        )
-        rich_text += f'<span style="background-color: #E6FFE6; color: #28a745;">{actual_replacement}</span>'
+      if added_span is not None:
+        rich_append(added_span)
       else:
         # Show match in red if no replacement
-        match_text = title[match.start() : match.end()]
-        rich_text += f'<span style="background-color: #FFE6E6; color: #FF0000;">{match_text}</span>'
+        rich_append(_REMOVED_SPAN)
+        rich_append(match.group(0))
+        rich_append(_SPAN_END)
 
-      last_end = match.end()
+      last_end = end
 
     # Add remaining text
-    rich_text += title[last_end:]
+    rest = title[last_end:]
+    plain_append(rest)
+    rich_append(rest)
+
+    processed_title = "".join(plain_parts)
+    rich_text = "".join(rich_parts)
 
     return processed_title, rich_text
 
   except (re.error, Exception) as e:
     logging.error(f"Error applying pattern: {str(e)}")
     return title, ""
+
+
+def apply_patterns(
+  title: str,
+  patterns: List[Tuple[re.Pattern, str]],
+  global_counter: int,
+  want_rich: bool = True,
+) -> Tuple[str, str]:
+  """Apply regex patterns to a title in sequence.
+
+  Args:
+    title: The title to process
+    patterns: List of (compiled pattern, replacement) tuples
+    global_counter: Current chapter counter
+    want_rich: If False, skip building the rich text preview
+
+  Returns:
+    Tuple of (processed_title, rich_text_preview) where the preview is the
+    one from the last pattern that matched, or "" if none matched
+  """
+  try:
+    current_title = title
+    preview = ""
+
+    for pattern, replacement_text in patterns:
+      # Apply pattern and get both the new title and rich text preview
+      current_title, rich_text = apply_single_pattern(
+        current_title, pattern, replacement_text, global_counter, want_rich
+      )
+      # Keep the last preview that had changes
+      if rich_text:
+        preview = rich_text
+
+    return current_title, preview
+
+  except Exception as e:
+    logging.error(f"Error processing title: {str(e)}")
+    return title, ""
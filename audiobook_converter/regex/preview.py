@@ -0,0 +1,58 @@
+import re
+from typing import Callable, List, Optional, Tuple
+from PyQt6.QtCore import QThread, pyqtSignal
+from .pattern import apply_patterns
+
+
+def build_preview(
+  titles: List[str],
+  patterns: List[Tuple[re.Pattern, str]],
+  should_stop: Optional[Callable[[], bool]] = None,
+  want_rich: bool = True,
+) -> List[Tuple[str, str]]:
+  """Apply patterns to every title, numbering chapters from 1.
+
+  Args:
+    titles: Original chapter titles
+    patterns: List of (compiled pattern, replacement) tuples
+    should_stop: Optional callable checked before each title to abort early
+    want_rich: If False, preview texts are the plain processed titles
+
+  Returns:
+    List of (processed_title, preview_text) tuples, one per title processed
+  """
+  results = []
+  for global_counter, title in enumerate(titles, start=1):
+    if should_stop and should_stop():
+      break
+    processed_title, rich_text = apply_patterns(
+      title, patterns, global_counter, want_rich
+    )
+    results.append((processed_title, rich_text or processed_title))
+  return results
+
+
+class PreviewThread(QThread):
+  ready = pyqtSignal(list)
+
+  def __init__(
+    self,
+    titles: List[str],
+    patterns: List[Tuple[re.Pattern, str]],
+    want_rich: bool = True,
+    parent=None,
+  ):
+    super().__init__(parent)
+    self.titles = list(titles)
+    self.patterns = list(patterns)
+    self.want_rich = want_rich
+
+  def run(self):
+    results = build_preview(
+      self.titles,
+      self.patterns,
+      should_stop=self.isInterruptionRequested,
+      want_rich=self.want_rich,
+    )
+    if not self.isInterruptionRequested():
+      self.ready.emit(results)
@@ -1,6 +1,8 @@
+import re
 import logging
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from PyQt6.QtWidgets import (
+  QAbstractItemView,
   QFrame,
   QHBoxLayout,
   QPushButton,
@@ -11,6 +13,7 @@ from PyQt6.QtWidgets import (
   QSizePolicy,
 )
 from PyQt6.QtCore import pyqtSignal, Qt
+from .pattern import compile_pattern
 
 
 class RegexPatternWidget(QFrame):
@@ -20,6 +23,10 @@ class RegexPatternWidget(QFrame):
     super().__init__(parent)
     self.setFrameStyle(QFrame.Shape.StyledPanel)
 
+    # Pattern text the cached compiled regex was built from
+    self._compiled_text: Optional[str] = None
+    self._compiled: Optional[re.Pattern] = None
+
     layout = QHBoxLayout(self)
     layout.setContentsMargins(4, 4, 4, 4)
     layout.setSpacing(8)
@@ -56,13 +63,31 @@ class RegexPatternWidget(QFrame):
   def get_pattern(self) -> Tuple[str, str]:
     return self.pattern_input.text(), self.replacement_input.text()
 
+  def get_compiled(self) -> Tuple[Optional[re.Pattern], str]:
+    """Return the compiled pattern and replacement text.
+
+    The regex is compiled when the pattern text changes and cached otherwise.
+    The pattern is None if the text is empty or not a valid regex.
+    """
+    pattern_text = self.pattern_input.text()
+    if pattern_text != self._compiled_text:
+      self._compiled_text = pattern_text
+      self._compiled = None
+      if pattern_text:
+        try:
+          self._compiled = compile_pattern(pattern_text)
+        except re.error as e:
+          logging.error(f"Invalid regex pattern: {str(e)}")
+    return self._compiled, self.replacement_input.text()
+
   def set_pattern(self, pattern: str, replacement: str) -> None:
     self.pattern_input.setText(pattern)
     self.replacement_input.setText(replacement)
 
 
 class RegexListWidget(QListWidget):
-  patternsChanged = pyqtSignal()
+  patternsChanged = pyqtSignal()  # Patterns added, removed or reordered
+  patternEdited = pyqtSignal()  # Text typed into a pattern field
 
   def __init__(self, parent=None):
     super().__init__(parent)
@@ -93,115 +118,60 @@ class RegexListWidget(QListWidget):
       logging.error(f"Error getting regex patterns: {str(e)}")
     return patterns
 
+  def get_compiled_patterns(self) -> List[Tuple[re.Pattern, str]]:
+    """Return (compiled pattern, replacement) for each valid pattern in order."""
+    patterns = []
+    for i in range(self.count()):
+      widget = self.itemWidget(self.item(i))
+      if not widget:
+        continue
+      pattern, replacement = widget.get_compiled()
+      if pattern is not None:
+        patterns.append((pattern, replacement))
+    return patterns
+
+  @staticmethod
+  def _set_widget_pattern(widget: RegexPatternWidget, pattern: Tuple[str, str]):
+    # Silence per-field signals, callers emit patternsChanged once
+    widget.pattern_input.blockSignals(True)
+    widget.replacement_input.blockSignals(True)
+    widget.set_pattern(*pattern)
+    widget.pattern_input.blockSignals(False)
+    widget.replacement_input.blockSignals(False)
+
+  def _set_patterns(self, start: int, patterns: List[Tuple[str, str]]) -> None:
+    """Write patterns into the existing widgets from row start onwards.
+
+    Widgets and their signal connections stay in place, only the text moves.
+    """
+    for offset, pattern in enumerate(patterns):
+      self._set_widget_pattern(self.itemWidget(self.item(start + offset)), pattern)
+
+  def _swap_with(self, item: QListWidgetItem, other_row: int) -> None:
+    current_widget = self.itemWidget(item)
+    other_item = self.item(other_row)
+    other_widget = self.itemWidget(other_item)
+    if not current_widget or not other_widget:
+      return
+
+    # Swap the pattern text between the two rows
+    current_pattern = current_widget.get_pattern()
+    self._set_widget_pattern(current_widget, other_widget.get_pattern())
+    self._set_widget_pattern(other_widget, current_pattern)
+
+    # Keep the selection on the moved pattern
+    self.setCurrentItem(other_item)
+    self.patternsChanged.emit()
+
   def move_pattern_up(self, item: QListWidgetItem) -> None:
     row = self.row(item)
     if row > 0:
-      # Store the current pattern and widget state
-      current_widget = self.itemWidget(item)
-      if not current_widget:
-        return
-      current_pattern = current_widget.get_pattern()
-
-      # Store the widget above's state
-      above_item = self.item(row - 1)
-      above_widget = self.itemWidget(above_item)
-      if not above_widget:
-        return
-      above_pattern = above_widget.get_pattern()
-
-      # Create new widgets with the swapped patterns
-      new_current = RegexPatternWidget()
-      new_current.set_pattern(*above_pattern)
-      new_above = RegexPatternWidget()
-      new_above.set_pattern(*current_pattern)
-
-      # Connect signals for the current widget (moving down)
-      new_current.patternChanged.connect(self.patternsChanged)
-      new_current.remove_button.clicked.connect(
-        lambda checked=False, i=item: self.remove_pattern(i)
-      )
-      new_current.up_button.clicked.connect(
-        lambda checked=False, i=item: self.move_pattern_up(i)
-      )
-      new_current.down_button.clicked.connect(
-        lambda checked=False, i=item: self.move_pattern_down(i)
-      )
-
-      # Connect signals for the above widget (moving up)
-      new_above.patternChanged.connect(self.patternsChanged)
-      new_above.remove_button.clicked.connect(
-        lambda checked=False, i=above_item: self.remove_pattern(i)
-      )
-      new_above.up_button.clicked.connect(
-        lambda checked=False, i=above_item: self.move_pattern_up(i)
-      )
-      new_above.down_button.clicked.connect(
-        lambda checked=False, i=above_item: self.move_pattern_down(i)
-      )
-
-      # Set the widgets
-      self.setItemWidget(item, new_current)
-      self.setItemWidget(above_item, new_above)
-
-      # Update button states and selection
-      self.setCurrentItem(above_item)
-      self.update_move_buttons()
-      self.patternsChanged.emit()
+      self._swap_with(item, row - 1)
 
   def move_pattern_down(self, item: QListWidgetItem) -> None:
     row = self.row(item)
     if row < self.count() - 1:
-      # Store the current pattern and widget state
-      current_widget = self.itemWidget(item)
-      if not current_widget:
-        return
-      current_pattern = current_widget.get_pattern()
-
-      # Store the widget below's state
-      below_item = self.item(row + 1)
-      below_widget = self.itemWidget(below_item)
-      if not below_widget:
-        return
-      below_pattern = below_widget.get_pattern()
-
-      # Create new widgets with the swapped patterns
-      new_current = RegexPatternWidget()
-      new_current.set_pattern(*below_pattern)
-      new_below = RegexPatternWidget()
-      new_below.set_pattern(*current_pattern)
-
-      # Connect signals for the current widget (moving down)
-      new_current.patternChanged.connect(self.patternsChanged)
-      new_current.remove_button.clicked.connect(
-        lambda checked=False, i=item: self.remove_pattern(i)
-      )
-      new_current.up_button.clicked.connect(
-        lambda checked=False, i=item: self.move_pattern_up(i)
-      )
-      new_current.down_button.clicked.connect(
-        lambda checked=False, i=item: self.move_pattern_down(i)
-      )
-
-      # Connect signals for the below widget (moving up)
-      new_below.patternChanged.connect(self.patternsChanged)
-      new_below.remove_button.clicked.connect(
-        lambda checked=False, i=below_item: self.remove_pattern(i)
-      )
-      new_below.up_button.clicked.connect(
-        lambda checked=False, i=below_item: self.move_pattern_up(i)
-      )
-      new_below.down_button.clicked.connect(
-        lambda checked=False, i=below_item: self.move_pattern_down(i)
-      )
-
-      # Set the widgets
-      self.setItemWidget(item, new_current)
-      self.setItemWidget(below_item, new_below)
-
-      # Update button states and selection
-      self.setCurrentItem(below_item)
-      self.update_move_buttons()
-      self.patternsChanged.emit()
+      self._swap_with(item, row + 1)
 
   def update_move_buttons(self) -> None:
     for i in range(self.count()):
@@ -217,7 +187,7 @@ class RegexListWidget(QListWidget):
     pattern_widget = RegexPatternWidget()
 
     # Connect signals
-    pattern_widget.patternChanged.connect(self.patternsChanged)
+    pattern_widget.patternChanged.connect(self.patternEdited)
     pattern_widget.remove_button.clicked.connect(
       lambda checked=False, item=item: self.remove_pattern(item)
     )
@@ -241,40 +211,41 @@ class RegexListWidget(QListWidget):
     self.patternsChanged.emit()
 
   def dropEvent(self, event) -> None:
-    # Store current patterns and widgets before drop
-    stored_data = []
-    for i in range(self.count()):
-      item = self.item(i)
-      widget = self.itemWidget(item)
-      if widget:
-        pattern = widget.get_pattern()
-        stored_data.append((pattern, widget))
-
-    # Handle the drop
-    super().dropEvent(event)
-
-    # Restore widgets and patterns after drop
-    for i in range(min(len(stored_data), self.count())):
-      item = self.item(i)
-      if item:
-        pattern, old_widget = stored_data[i]
-        # Create a new widget to avoid Qt ownership issues
-        new_widget = RegexPatternWidget()
-        new_widget.set_pattern(*pattern)
-        # Connect signals
-        new_widget.patternChanged.connect(self.patternsChanged)
-        new_widget.remove_button.clicked.connect(
-          lambda checked=False, item=item: self.remove_pattern(item)
-        )
-        new_widget.up_button.clicked.connect(
-          lambda checked=False, item=item: self.move_pattern_up(item)
-        )
-        new_widget.down_button.clicked.connect(
-          lambda checked=False, item=item: self.move_pattern_down(item)
-        )
-        # Set the widget
-        item.setSizeHint(new_widget.sizeHint())
-        self.setItemWidget(item, new_widget)
-
-    self.update_move_buttons()
+    source_row = self.currentRow()
+    if event.source() is not self or source_row < 0:
+      event.ignore()
+      return
+
+    # Work out the row the dragged pattern should end up in
+    target = self.indexAt(event.position().toPoint())
+    if not target.isValid():
+      dest_row = self.count() - 1
+    else:
+      dest_row = target.row()
+      if (
+        self.dropIndicatorPosition()
+        == QAbstractItemView.DropIndicatorPosition.BelowItem
+      ):
+        dest_row += 1
+      if dest_row > source_row:
+        dest_row -= 1  # The source row is removed before inserting
+
+    # Report a copy so Qt doesn't remove the source row after the drop,
+    # the reorder is done by moving text between the existing widgets
+    event.setDropAction(Qt.DropAction.CopyAction)
+    event.accept()
+
+    if dest_row == source_row:
+      return
+
+    first = min(source_row, dest_row)
+    last = max(source_row, dest_row)
+    patterns = [
+      self.itemWidget(self.item(i)).get_pattern() for i in range(first, last + 1)
+    ]
+    moved = patterns.pop(source_row - first)
+    patterns.insert(dest_row - first, moved)
+    self._set_patterns(first, patterns)
+
+    self.setCurrentRow(dest_row)
     self.patternsChanged.emit()
@@ -1,23 +1,73 @@
 import logging
-from PyQt6.QtCore import pyqtSignal
+import queue
+import threading
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from PyQt6.QtCore import QTimer, pyqtSignal
+
+# Milliseconds between batched log signal emissions
+LOG_FLUSH_INTERVAL = 50
 
 
 class LogHandler(logging.Handler):
+  """Buffer formatted records and emit them to the signal in batches.
+
+  Records arrive on the listener thread; flush() runs on the GUI thread from
+  a timer, so a burst of records costs one signal instead of one per line.
+  """
+
   def __init__(self, signal):
     super().__init__()
     self.signal = signal
+    self.pending = deque(maxlen=1024)
+    self.pending_lock = threading.Lock()
 
   def emit(self, record):
     msg = self.format(record)
-    self.signal.emit(msg)
+    with self.pending_lock:
+      self.pending.append(msg)
+
+  def flush(self):
+    with self.pending_lock:
+      if not self.pending:
+        return
+      messages = list(self.pending)
+      self.pending.clear()
+    self.signal.emit("\n".join(messages))
+
 
+def setup_logging(
+  log_signal: pyqtSignal, level: int = logging.INFO
+) -> QueueListener:
+  """Route log records to log_signal through a background listener thread.
 
-def setup_logging(log_signal: pyqtSignal):
+  Producers only enqueue records; formatting happens on the listener thread
+  and the signal is emitted in batches from a GUI thread timer. The caller
+  must stop the returned listener on exit.
+
+  Args:
+    log_signal: Signal receiving the formatted log lines
+    level: Lowest level shown, records below it are dropped before formatting
+
+  Returns:
+    The started QueueListener
+  """
   handler = LogHandler(log_signal)
+  handler.setLevel(level)
   handler.setFormatter(
     logging.Formatter(
       "%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
     )
   )
-  logging.getLogger().addHandler(handler)
-  logging.getLogger().setLevel(logging.INFO)
+  log_queue = queue.SimpleQueue()
+  listener = QueueListener(log_queue, handler)
+  listener.start()
+
+  # Kept alive by the handler, which the listener holds on to
+  handler.flush_timer = QTimer()
+  handler.flush_timer.timeout.connect(handler.flush)
+  handler.flush_timer.start(LOG_FLUSH_INTERVAL)
+
+  logging.getLogger().addHandler(QueueHandler(log_queue))
+  logging.getLogger().setLevel(level)
+  return listener